@@ -0,0 +1,28 @@
+"""add reports advisor/generated_at composite index
+
+Revision ID: 7c1f3a9b2d4e
+Revises: e0b602d1ae2f
+Create Date: 2026-10-16 09:12:44.318205
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '7c1f3a9b2d4e'
+down_revision: Union[str, None] = 'e0b602d1ae2f'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index('ix_reports_advisor_generated', 'reports', ['advisor_id', 'generated_at'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_reports_advisor_generated', table_name='reports')
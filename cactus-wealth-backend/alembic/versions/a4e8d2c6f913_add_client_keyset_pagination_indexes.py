@@ -0,0 +1,30 @@
+"""add (client_id, id) indexes for keyset pagination
+
+Revision ID: a4e8d2c6f913
+Revises: 7c1f3a9b2d4e
+Create Date: 2026-10-16 10:41:07.552931
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a4e8d2c6f913'
+down_revision: Union[str, None] = '7c1f3a9b2d4e'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index('ix_investment_accounts_client_id_id', 'investment_accounts', ['client_id', 'id'], unique=False)
+    op.create_index('ix_insurance_policies_client_id_id', 'insurance_policies', ['client_id', 'id'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_insurance_policies_client_id_id', table_name='insurance_policies')
+    op.drop_index('ix_investment_accounts_client_id_id', table_name='investment_accounts')
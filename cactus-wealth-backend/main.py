@@ -3,6 +3,8 @@
 CactusDashboard Backend - FastAPI Application Entry Point
 """
 
+from contextlib import asynccontextmanager
+
 import uvicorn
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
@@ -10,9 +12,20 @@ from fastapi.staticfiles import StaticFiles
 
 from cactus_wealth.core.config import settings
 from cactus_wealth.api.v1.api import api_router
+from cactus_wealth.services import create_backtest_redis_client
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Open shared clients inside the server's event loop and close them on shutdown."""
+    app.state.backtest_redis_client = create_backtest_redis_client()
+    yield
+    await app.state.backtest_redis_client.aclose()
+
 
 # Create FastAPI app instance
 app = FastAPI(
+    lifespan=lifespan,
     title="CactusDashboard API",
     description="Wealth Management Platform API",
     version="1.0.0",
@@ -1,5 +1,5 @@
 from cactus_wealth.database import get_session
-from cactus_wealth.models import User
+from cactus_wealth.models import InsurancePolicy, User
 from cactus_wealth.schemas import (
     InsurancePolicyCreate,
     InsurancePolicyRead,
@@ -7,7 +7,7 @@ from cactus_wealth.schemas import (
 )
 from cactus_wealth.security import get_current_user
 from cactus_wealth.services import InsurancePolicyService
-from fastapi import APIRouter, Depends, status
+from fastapi import APIRouter, Depends, Query, Response, status
 from sqlmodel import Session
 
 router = APIRouter()
@@ -30,7 +30,7 @@ def create_insurance_policy_for_client(
     policy_create: InsurancePolicyCreate,
     current_user: User = Depends(get_current_user),
     policy_service: InsurancePolicyService = Depends(get_policy_service),
-) -> InsurancePolicyRead:
+) -> InsurancePolicy:
     """
     Create a new insurance policy for a specific client.
     The client must belong to the authenticated advisor (or advisor must be ADMIN).
@@ -38,7 +38,7 @@ def create_insurance_policy_for_client(
     policy = policy_service.create_policy_for_client(
         policy_data=policy_create, client_id=client_id, current_advisor=current_user
     )
-    return InsurancePolicyRead.model_validate(policy)
+    return policy
 
 
 @router.get("/insurance-policies/{policy_id}", response_model=InsurancePolicyRead)
@@ -46,7 +46,7 @@ def get_insurance_policy(
     policy_id: int,
     current_user: User = Depends(get_current_user),
     policy_service: InsurancePolicyService = Depends(get_policy_service),
-) -> InsurancePolicyRead:
+) -> InsurancePolicy:
     """
     Get a specific insurance policy by ID.
     Access is restricted to policies belonging to the advisor's clients.
@@ -54,7 +54,7 @@ def get_insurance_policy(
     policy = policy_service.get_policy(
         policy_id=policy_id, current_advisor=current_user
     )
-    return InsurancePolicyRead.model_validate(policy)
+    return policy
 
 
 @router.get(
@@ -62,19 +62,27 @@ def get_insurance_policy(
 )
 def get_insurance_policies_for_client(
     client_id: int,
-    skip: int = 0,
-    limit: int = 100,
+    response: Response,
+    cursor: int | None = Query(
+        None, ge=0, description="ID of the last record from the previous page"
+    ),
+    limit: int = Query(
+        100, ge=1, le=500, description="Maximum number of records to return"
+    ),
     current_user: User = Depends(get_current_user),
     policy_service: InsurancePolicyService = Depends(get_policy_service),
-) -> list[InsurancePolicyRead]:
+) -> list[InsurancePolicy]:
     """
-    Get all insurance policies for a specific client.
+    Get a page of insurance policies for a specific client.
     The client must belong to the authenticated advisor (or advisor must be ADMIN).
+    The X-Next-Cursor header carries the cursor for the next page, if any.
     """
-    policies = policy_service.get_policies_by_client(
-        client_id=client_id, current_advisor=current_user, skip=skip, limit=limit
+    policies, next_cursor = policy_service.get_policies_by_client(
+        client_id=client_id, current_advisor=current_user, cursor=cursor, limit=limit
     )
-    return [InsurancePolicyRead.model_validate(policy) for policy in policies]
+    if next_cursor is not None:
+        response.headers["X-Next-Cursor"] = str(next_cursor)
+    return policies
 
 
 @router.put("/insurance-policies/{policy_id}", response_model=InsurancePolicyRead)
@@ -83,7 +91,7 @@ def update_insurance_policy(
     policy_update: InsurancePolicyUpdate,
     current_user: User = Depends(get_current_user),
     policy_service: InsurancePolicyService = Depends(get_policy_service),
-) -> InsurancePolicyRead:
+) -> InsurancePolicy:
     """
     Update an insurance policy.
     Access is restricted to policies belonging to the advisor's clients.
@@ -91,7 +99,7 @@ def update_insurance_policy(
     policy = policy_service.update_policy(
         policy_id=policy_id, update_data=policy_update, current_advisor=current_user
     )
-    return InsurancePolicyRead.model_validate(policy)
+    return policy
 
 
 @router.delete("/insurance-policies/{policy_id}", response_model=InsurancePolicyRead)
@@ -99,7 +107,7 @@ def delete_insurance_policy(
     policy_id: int,
     current_user: User = Depends(get_current_user),
     policy_service: InsurancePolicyService = Depends(get_policy_service),
-) -> InsurancePolicyRead:
+) -> InsurancePolicy:
     """
     Delete an insurance policy.
     Access is restricted to policies belonging to the advisor's clients.
@@ -107,4 +115,4 @@ def delete_insurance_policy(
     policy = policy_service.delete_policy(
         policy_id=policy_id, current_advisor=current_user
     )
-    return InsurancePolicyRead.model_validate(policy)
+    return policy
@@ -1,5 +1,5 @@
 from cactus_wealth.database import get_session
-from cactus_wealth.models import User
+from cactus_wealth.models import InvestmentAccount, User
 from cactus_wealth.schemas import (
     InvestmentAccountCreate,
     InvestmentAccountRead,
@@ -7,7 +7,7 @@ from cactus_wealth.schemas import (
 )
 from cactus_wealth.security import get_current_user
 from cactus_wealth.services import InvestmentAccountService
-from fastapi import APIRouter, Depends, File, UploadFile, status
+from fastapi import APIRouter, Depends, File, Query, Response, UploadFile, status
 from sqlmodel import Session
 
 router = APIRouter()
@@ -30,7 +30,7 @@ def create_investment_account_for_client(
     account_create: InvestmentAccountCreate,
     current_user: User = Depends(get_current_user),
     account_service: InvestmentAccountService = Depends(get_account_service),
-) -> InvestmentAccountRead:
+) -> InvestmentAccount:
     """
     Create a new investment account for a specific client.
     The client must belong to the authenticated advisor (or advisor must be ADMIN).
@@ -38,7 +38,7 @@ def create_investment_account_for_client(
     account = account_service.create_account_for_client(
         account_data=account_create, client_id=client_id, current_advisor=current_user
     )
-    return InvestmentAccountRead.model_validate(account)
+    return account
 
 
 @router.get("/investment-accounts/{account_id}", response_model=InvestmentAccountRead)
@@ -46,7 +46,7 @@ def get_investment_account(
     account_id: int,
     current_user: User = Depends(get_current_user),
     account_service: InvestmentAccountService = Depends(get_account_service),
-) -> InvestmentAccountRead:
+) -> InvestmentAccount:
     """
     Get a specific investment account by ID.
     Access is restricted to accounts belonging to the advisor's clients.
@@ -54,7 +54,7 @@ def get_investment_account(
     account = account_service.get_account(
         account_id=account_id, current_advisor=current_user
     )
-    return InvestmentAccountRead.model_validate(account)
+    return account
 
 
 @router.get(
@@ -63,19 +63,27 @@ def get_investment_account(
 )
 def get_investment_accounts_for_client(
     client_id: int,
-    skip: int = 0,
-    limit: int = 100,
+    response: Response,
+    cursor: int | None = Query(
+        None, ge=0, description="ID of the last record from the previous page"
+    ),
+    limit: int = Query(
+        100, ge=1, le=500, description="Maximum number of records to return"
+    ),
     current_user: User = Depends(get_current_user),
     account_service: InvestmentAccountService = Depends(get_account_service),
-) -> list[InvestmentAccountRead]:
+) -> list[InvestmentAccount]:
     """
-    Get all investment accounts for a specific client.
+    Get a page of investment accounts for a specific client.
     The client must belong to the authenticated advisor (or advisor must be ADMIN).
+    The X-Next-Cursor header carries the cursor for the next page, if any.
     """
-    accounts = account_service.get_accounts_by_client(
-        client_id=client_id, current_advisor=current_user, skip=skip, limit=limit
+    accounts, next_cursor = account_service.get_accounts_by_client(
+        client_id=client_id, current_advisor=current_user, cursor=cursor, limit=limit
     )
-    return [InvestmentAccountRead.model_validate(account) for account in accounts]
+    if next_cursor is not None:
+        response.headers["X-Next-Cursor"] = str(next_cursor)
+    return accounts
 
 
 @router.put("/investment-accounts/{account_id}", response_model=InvestmentAccountRead)
@@ -84,7 +92,7 @@ def update_investment_account(
     account_update: InvestmentAccountUpdate,
     current_user: User = Depends(get_current_user),
     account_service: InvestmentAccountService = Depends(get_account_service),
-) -> InvestmentAccountRead:
+) -> InvestmentAccount:
     """
     Update an investment account.
     Access is restricted to accounts belonging to the advisor's clients.
@@ -92,7 +100,7 @@ def update_investment_account(
     account = account_service.update_account(
         account_id=account_id, update_data=account_update, current_advisor=current_user
     )
-    return InvestmentAccountRead.model_validate(account)
+    return account
 
 
 @router.delete(
@@ -102,7 +110,7 @@ def delete_investment_account(
     account_id: int,
     current_user: User = Depends(get_current_user),
     account_service: InvestmentAccountService = Depends(get_account_service),
-) -> InvestmentAccountRead:
+) -> InvestmentAccount:
     """
     Delete an investment account.
     Access is restricted to accounts belonging to the advisor's clients.
@@ -110,7 +118,7 @@ def delete_investment_account(
     account = account_service.delete_account(
         account_id=account_id, current_advisor=current_user
     )
-    return InvestmentAccountRead.model_validate(account)
+    return account
 
 
 @router.post(
@@ -1,6 +1,9 @@
 import logging
+from collections.abc import Iterator
 from typing import Annotated
 
+import redis.asyncio as aioredis
+
 from cactus_wealth import schemas
 from cactus_wealth.core.dataprovider import YahooFinanceProvider
 from cactus_wealth.database import get_session
@@ -11,8 +14,8 @@ from cactus_wealth.services import (
     PortfolioService,
     ReportService,
 )
-from fastapi import APIRouter, Depends, HTTPException, status
-from fastapi.responses import Response
+from fastapi import APIRouter, Depends, HTTPException, Request, status
+from fastapi.responses import Response, StreamingResponse
 from sqlmodel import Session, select
 
 logger = logging.getLogger(__name__)
@@ -179,11 +182,17 @@ def download_portfolio_report(
         )
 
 
+def get_backtest_redis_client(http_request: Request) -> aioredis.Redis | None:
+    """Dependency returning the backtest cache client opened by the app lifespan."""
+    return getattr(http_request.app.state, "backtest_redis_client", None)
+
+
 @router.post("/backtest", response_model=schemas.BacktestResponse)
 async def backtest_portfolio(
     request: schemas.BacktestRequest,
     current_user: Annotated[User, Depends(get_current_active_user)],
-) -> schemas.BacktestResponse:
+    redis_client: Annotated[aioredis.Redis | None, Depends(get_backtest_redis_client)],
+) -> Response:
     """
     Perform optimized portfolio backtesting with Redis caching and concurrency.
 
@@ -207,6 +216,7 @@ async def backtest_portfolio(
     Args:
         request: BacktestRequest with portfolio composition, benchmarks, and period
         current_user: Currently authenticated user (advisor)
+        redis_client: Shared async Redis client for the price cache (None disables caching)
 
     Returns:
         BacktestResponse with complete historical performance analysis
@@ -217,13 +227,58 @@ async def backtest_portfolio(
     logger.info(
         f"Optimized portfolio backtesting requested by user {current_user.email}"
     )
+    result = await _run_backtest(request, redis_client)
+
+    # Serialize with pydantic-core directly; the default encoder walks every
+    # data point through jsonable_encoder first
+    return Response(content=result.model_dump_json(), media_type="application/json")
+
+
+@router.post("/backtest/stream")
+async def stream_backtest_portfolio(
+    request: schemas.BacktestRequest,
+    current_user: Annotated[User, Depends(get_current_active_user)],
+    redis_client: Annotated[aioredis.Redis | None, Depends(get_backtest_redis_client)],
+) -> StreamingResponse:
+    """
+    Perform portfolio backtesting and stream the result as NDJSON.
+
+    The first line holds the backtest summary (dates, composition, benchmarks
+    and performance metrics); every following line is one data point. Suited
+    to long periods where the full response would be large.
+
+    Args:
+        request: BacktestRequest with portfolio composition, benchmarks, and period
+        current_user: Currently authenticated user (advisor)
+        redis_client: Shared async Redis client for the price cache (None disables caching)
 
+    Returns:
+        StreamingResponse with application/x-ndjson content
+
+    Raises:
+        HTTPException: If backtesting fails or invalid parameters provided
+    """
+    logger.info(f"Streaming portfolio backtest requested by user {current_user.email}")
+    result = await _run_backtest(request, redis_client)
+
+    def iter_lines() -> Iterator[str]:
+        yield result.model_dump_json(exclude={"data_points"}) + "\n"
+        for point in result.data_points:
+            yield point.model_dump_json() + "\n"
+
+    return StreamingResponse(iter_lines(), media_type="application/x-ndjson")
+
+
+async def _run_backtest(
+    request: schemas.BacktestRequest, redis_client: aioredis.Redis | None
+) -> schemas.BacktestResponse:
+    """Run a backtest, mapping service errors to HTTP errors."""
     try:
         # The optimized service now handles all validation internally
         # including portfolio weights and ticker validation
 
         # Create optimized backtest service and perform concurrent analysis
-        backtest_service = PortfolioBacktestService()
+        backtest_service = PortfolioBacktestService(redis_client=redis_client)
         result = await backtest_service.perform_backtest(request)
 
         logger.info(
@@ -3,6 +3,10 @@ import os
 from arq import create_pool
 from arq.connections import ArqRedis, RedisSettings
 
+# Fixed job id so overlapping triggers (or worker restarts) collapse into a
+# single snapshot run instead of writing duplicate snapshots
+SNAPSHOT_JOB_ID = "create_all_snapshots"
+
 
 class ARQConfig:
     """Centralized ARQ configuration for the application."""
@@ -18,25 +22,30 @@ class ARQConfig:
         return await create_pool(ARQConfig.get_redis_settings())
 
     @staticmethod
-    async def enqueue_snapshot_job(redis_pool: ArqRedis | None = None) -> str:
+    async def enqueue_snapshot_job(redis_pool: ArqRedis | None = None) -> str | None:
         """
         Manually enqueue a snapshot creation job.
 
         This function can be used by the FastAPI app to trigger
-        snapshot creation on demand.
+        snapshot creation on demand. While a snapshot job is already queued or
+        running the trigger is refused; the worker keeps no result for this
+        job, so a new one can be enqueued as soon as the previous run ends.
 
         Args:
             redis_pool: Optional Redis pool. If None, a new one will be created.
 
         Returns:
-            Job ID of the enqueued task
+            Job ID of the enqueued task, or None if a snapshot job is already
+            queued or running
         """
         pool = redis_pool or await ARQConfig.get_redis_pool()
 
         try:
-            job = await pool.enqueue_job("create_all_snapshots")
-            job_id = job.job_id if job else "unknown"
-            return job_id
+            job = await pool.enqueue_job(
+                "create_all_snapshots", _job_id=SNAPSHOT_JOB_ID
+            )
+            # ARQ returns None when a job with this id already exists
+            return job.job_id if job else None
         finally:
             if not redis_pool:  # Only close if we created the pool
                 await pool.close()
@@ -51,6 +60,8 @@ async def trigger_snapshots_manually():
     '''Administrative endpoint to manually trigger portfolio snapshots.'''
     try:
         job_id = await ARQConfig.enqueue_snapshot_job()
+        if job_id is None:
+            return {"message": "Snapshot job already queued or running"}
         return {"message": "Snapshot job enqueued", "job_id": job_id}
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to enqueue job: {str(e)}")
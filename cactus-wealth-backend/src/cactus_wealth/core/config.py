@@ -13,6 +13,7 @@ class Settings(BaseSettings):
     # Application
     APP_NAME: str = "CactusDashboard"
     DEBUG: bool = False
+    TESTING: bool = False
     VERSION: str = "1.0.0"
     
     # Database
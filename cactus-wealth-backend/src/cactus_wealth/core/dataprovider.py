@@ -1,6 +1,7 @@
 import logging
 from abc import ABC, abstractmethod
 
+import pandas as pd
 import yfinance as yf
 
 logger = logging.getLogger(__name__)
@@ -26,6 +27,28 @@ class MarketDataProvider(ABC):
         """
         pass
 
+    def get_current_prices(self, tickers: list[str]) -> dict[str, float]:
+        """
+        Get current prices for several ticker symbols.
+
+        Providers with a batch endpoint should override this; the default
+        looks each ticker up individually.
+
+        Args:
+            tickers: The ticker symbols
+
+        Returns:
+            Mapping of ticker to current price. Tickers that could not be
+            priced are left out.
+        """
+        prices = {}
+        for ticker in dict.fromkeys(tickers):
+            try:
+                prices[ticker] = self.get_current_price(ticker)
+            except Exception as e:
+                logger.warning(f"Could not price {ticker}: {str(e)}")
+        return prices
+
 
 class YahooFinanceProvider(MarketDataProvider):
     """Yahoo Finance implementation of MarketDataProvider."""
@@ -72,6 +95,50 @@ class YahooFinanceProvider(MarketDataProvider):
                     f"Failed to retrieve market data for {ticker}: {str(e)}"
                 )
 
+    def get_current_prices(self, tickers: list[str]) -> dict[str, float]:
+        """
+        Get the current prices for several tickers with one Yahoo Finance request.
+
+        Args:
+            tickers: The ticker symbols
+
+        Returns:
+            Mapping of ticker to most recent closing price. Tickers without
+            valid data are left out.
+        """
+        tickers = list(dict.fromkeys(tickers))
+        if not tickers:
+            return {}
+
+        try:
+            data = yf.download(
+                tickers,
+                period="5d",
+                auto_adjust=True,
+                group_by="ticker",
+                threads=True,
+                progress=False,
+            )
+        except Exception as e:
+            logger.error(f"Error retrieving batch prices: {str(e)}")
+            return {}
+
+        prices = {}
+        for ticker in tickers:
+            try:
+                closes = (
+                    data[(ticker, "Close")]
+                    if isinstance(data.columns, pd.MultiIndex)
+                    else data["Close"]
+                ).dropna()
+            except KeyError:
+                continue
+            if not closes.empty and float(closes.iloc[-1]) > 0:
+                prices[ticker] = float(closes.iloc[-1])
+
+        logger.info(f"Retrieved batch prices for {len(prices)}/{len(tickers)} tickers")
+        return prices
+
 
 def get_market_data_provider() -> MarketDataProvider:
     """
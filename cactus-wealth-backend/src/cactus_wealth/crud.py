@@ -83,11 +83,15 @@ def create_user(session: Session, user_create: UserCreate) -> User:
 # ============ CLIENT CRUD OPERATIONS ============
 
 
-def get_client(session: Session, client_id: int, owner_id: int) -> Client | None:
-    """Get a specific client by ID, ensuring it belongs to the owner."""
-    statement = select(Client).where(
-        Client.id == client_id, Client.owner_id == owner_id
-    )
+def get_client(session: Session, client_id: int, owner_id: int | None) -> Client | None:
+    """
+    Get a specific client by ID, ensuring it belongs to the owner.
+
+    Pass owner_id=None to skip the ownership filter (e.g. for ADMIN users).
+    """
+    statement = select(Client).where(Client.id == client_id)
+    if owner_id is not None:
+        statement = statement.where(Client.owner_id == owner_id)
     return session.exec(statement).first()
 
 
@@ -237,17 +241,49 @@ def get_investment_account(
     return session.get(InvestmentAccount, account_id)
 
 
+def get_account_if_owned(
+    session: Session, account_id: int, owner_id: int | None
+) -> InvestmentAccount | None:
+    """
+    Get an investment account in one query, only if its client belongs to the owner.
+
+    Pass owner_id=None to skip the ownership filter (e.g. for ADMIN users).
+    """
+    statement = (
+        select(InvestmentAccount)
+        .join(Client, InvestmentAccount.client_id == Client.id)
+        .where(InvestmentAccount.id == account_id)
+    )
+    if owner_id is not None:
+        statement = statement.where(Client.owner_id == owner_id)
+    return session.exec(statement).first()
+
+
 def get_investment_accounts_by_client(
-    session: Session, client_id: int, skip: int = 0, limit: int = 100
-) -> list[InvestmentAccount]:
-    """Get all investment accounts for a specific client."""
+    session: Session, client_id: int, cursor: int | None = None, limit: int = 100
+) -> tuple[list[InvestmentAccount], int | None]:
+    """
+    Get a page of investment accounts for a specific client, with the client loaded.
+
+    Uses keyset pagination on the primary key: pass the returned next_cursor
+    back as cursor to fetch the following page (None when there is none).
+    """
+    if limit < 1:
+        raise ValueError("limit must be at least 1")
+
     statement = (
         select(InvestmentAccount)
         .where(InvestmentAccount.client_id == client_id)
-        .offset(skip)
-        .limit(limit)
+        .options(selectinload(InvestmentAccount.client))
+        .order_by(InvestmentAccount.id)
+        .limit(limit + 1)
     )
-    return list(session.exec(statement).all())
+    if cursor is not None:
+        statement = statement.where(InvestmentAccount.id > cursor)
+
+    rows = list(session.exec(statement).all())
+    next_cursor = rows[limit - 1].id if len(rows) > limit else None
+    return rows[:limit], next_cursor
 
 
 def update_investment_account(
@@ -316,17 +352,49 @@ def get_insurance_policy(session: Session, policy_id: int) -> InsurancePolicy |
     return session.get(InsurancePolicy, policy_id)
 
 
+def get_policy_if_owned(
+    session: Session, policy_id: int, owner_id: int | None
+) -> InsurancePolicy | None:
+    """
+    Get an insurance policy in one query, only if its client belongs to the owner.
+
+    Pass owner_id=None to skip the ownership filter (e.g. for ADMIN users).
+    """
+    statement = (
+        select(InsurancePolicy)
+        .join(Client, InsurancePolicy.client_id == Client.id)
+        .where(InsurancePolicy.id == policy_id)
+    )
+    if owner_id is not None:
+        statement = statement.where(Client.owner_id == owner_id)
+    return session.exec(statement).first()
+
+
 def get_insurance_policies_by_client(
-    session: Session, client_id: int, skip: int = 0, limit: int = 100
-) -> list[InsurancePolicy]:
-    """Get all insurance policies for a specific client."""
+    session: Session, client_id: int, cursor: int | None = None, limit: int = 100
+) -> tuple[list[InsurancePolicy], int | None]:
+    """
+    Get a page of insurance policies for a specific client, with the client loaded.
+
+    Uses keyset pagination on the primary key: pass the returned next_cursor
+    back as cursor to fetch the following page (None when there is none).
+    """
+    if limit < 1:
+        raise ValueError("limit must be at least 1")
+
     statement = (
         select(InsurancePolicy)
         .where(InsurancePolicy.client_id == client_id)
-        .offset(skip)
-        .limit(limit)
+        .options(selectinload(InsurancePolicy.client))
+        .order_by(InsurancePolicy.id)
+        .limit(limit + 1)
     )
-    return list(session.exec(statement).all())
+    if cursor is not None:
+        statement = statement.where(InsurancePolicy.id > cursor)
+
+    rows = list(session.exec(statement).all())
+    next_cursor = rows[limit - 1].id if len(rows) > limit else None
+    return rows[:limit], next_cursor
 
 
 def update_insurance_policy(
@@ -395,6 +395,9 @@ class Report(SQLModel, table=True):
         Index(
             "ix_reports_client_advisor", "client_id", "advisor_id"
         ),  # Composite index for report queries
+        Index(
+            "ix_reports_advisor_generated", "advisor_id", "generated_at"
+        ),  # Composite index for per-advisor quarterly counts
     )
 
 
@@ -426,6 +429,9 @@ class InvestmentAccount(SQLModel, table=True):
         Index(
             "ix_investment_accounts_client_platform", "client_id", "platform"
         ),  # Composite index for account queries
+        Index(
+            "ix_investment_accounts_client_id_id", "client_id", "id"
+        ),  # Composite index for keyset pagination
     )
 
 
@@ -459,6 +465,9 @@ class InsurancePolicy(SQLModel, table=True):
         Index(
             "ix_insurance_policies_client_type", "client_id", "insurance_type"
         ),  # Composite index for policy queries
+        Index(
+            "ix_insurance_policies_client_id_id", "client_id", "id"
+        ),  # Composite index for keyset pagination
     )
 
 
@@ -33,6 +33,32 @@ class NotificationRepository(BaseRepository[Notification]):
         )
         return list(self.session.exec(statement).all())
 
+    def create_many(
+        self, notifications: list[Notification], commit: bool = True
+    ) -> list[Notification]:
+        """
+        Insert several notifications with a single flush and at most one commit.
+
+        The flush assigns ids before any commit, so callers can read them
+        without a per-row refresh.
+
+        Args:
+            notifications: Notifications to persist
+            commit: Commit after flushing; pass False to commit later in the
+                caller's own unit of work
+
+        Returns:
+            The persisted notifications
+        """
+        if not notifications:
+            return []
+
+        self.session.add_all(notifications)
+        self.session.flush()
+        if commit:
+            self.session.commit()
+        return notifications
+
     def get_unread_by_user_id(self, user_id: int) -> list[Notification]:
         """
         Get all unread notifications for a specific user.
@@ -3,6 +3,7 @@ Portfolio repository for portfolio-related database operations.
 """
 
 from datetime import datetime, timedelta
+from decimal import Decimal
 
 from sqlalchemy.orm import selectinload
 from sqlmodel import Session, func, select
@@ -47,6 +48,28 @@ class PortfolioRepository(BaseRepository[Portfolio]):
         )
         return self.session.exec(statement).first()
 
+    def get_portfolios_with_positions(
+        self, portfolio_ids: list[int]
+    ) -> list[Portfolio]:
+        """
+        Get several portfolios with positions, assets and owning client loaded.
+
+        Args:
+            portfolio_ids: IDs of the portfolios to load
+
+        Returns:
+            List of matching portfolios with relationships loaded
+        """
+        statement = (
+            select(Portfolio)
+            .where(Portfolio.id.in_(portfolio_ids))
+            .options(
+                selectinload(Portfolio.positions).selectinload(Position.asset),
+                selectinload(Portfolio.client),
+            )
+        )
+        return list(self.session.exec(statement).all())
+
     def get_all_portfolios_with_positions(self) -> list[Portfolio]:
         """
         Get all portfolios with positions and assets loaded efficiently.
@@ -179,9 +202,41 @@ class PortfolioRepository(BaseRepository[Portfolio]):
         self.session.refresh(position)
         return position
 
-    def create_snapshot(self, portfolio_id: int, value) -> PortfolioSnapshot:
-        snapshot = PortfolioSnapshot(portfolio_id=portfolio_id, value=value)
+    def create_snapshot(
+        self, portfolio_id: int, value, timestamp: datetime | None = None
+    ) -> PortfolioSnapshot:
+        snapshot = PortfolioSnapshot(
+            portfolio_id=portfolio_id,
+            value=value,
+            timestamp=timestamp or datetime.utcnow(),
+        )
         self.session.add(snapshot)
         self.session.commit()
         self.session.refresh(snapshot)
         return snapshot
+
+    def create_snapshots_bulk(
+        self, values: dict[int, Decimal], timestamp: datetime
+    ) -> int:
+        """
+        Insert one snapshot per portfolio in a single batch and commit once.
+
+        Args:
+            values: Mapping of portfolio ID to snapshot value
+            timestamp: Timestamp shared by every snapshot in the batch
+
+        Returns:
+            Number of snapshots inserted
+        """
+        if not values:
+            return 0
+
+        self.session.bulk_insert_mappings(
+            PortfolioSnapshot,
+            [
+                {"portfolio_id": portfolio_id, "value": value, "timestamp": timestamp}
+                for portfolio_id, value in values.items()
+            ],
+        )
+        self.session.commit()
+        return len(values)
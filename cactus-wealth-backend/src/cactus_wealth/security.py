@@ -11,8 +11,10 @@ from jose import JWTError, jwt
 from passlib.context import CryptContext
 from sqlmodel import Session
 
-# Password hashing
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+# Password hashing (plaintext under TESTING so test fixtures skip bcrypt's cost)
+pwd_context = CryptContext(
+    schemes=["plaintext"] if settings.TESTING else ["bcrypt"], deprecated="auto"
+)
 
 # OAuth2 scheme
 oauth2_scheme = OAuth2PasswordBearer(
@@ -1,16 +1,22 @@
 import asyncio
-import hashlib
 import json
+import math
 from datetime import UTC, datetime, timedelta
 from decimal import Decimal
+from functools import lru_cache
+from io import BytesIO
 from pathlib import Path
 import os
+import tempfile
+from collections.abc import Iterable
 from typing import Any
 
+import aiofiles
 import cactus_wealth.crud as crud
 import numpy as np
 import pandas as pd
 import redis
+import redis.asyncio as aioredis
 import yfinance as yf
 from cactus_wealth import schemas
 from cactus_wealth.core.config import settings
@@ -41,6 +47,7 @@ from cactus_wealth.schemas import (
     PortfolioComposition,
 )
 from jinja2 import Environment, FileSystemLoader
+from sqlalchemy import and_, case
 from sqlmodel import Session, func, select
 from .core.logging_config import get_structured_logger
 from pydantic import BaseModel
@@ -48,6 +55,66 @@ from fastapi import HTTPException, status, UploadFile
 
 logger = get_structured_logger(__name__)
 
+CENTS = Decimal("0.01")
+
+# Leading byte of binary-encoded backtest cache entries
+_SERIES_CACHE_FORMAT = b"\x01"
+
+# On-disk second cache tier for backtest series; survives Redis flushes/evictions
+BACKTEST_DISK_CACHE_DIR = Path(os.getenv("BACKTEST_CACHE_DIR", "cache/yfinance"))
+
+# Backtest annualization constants (2% risk-free rate is a documented assumption)
+_TRADING_DAYS = 252
+_SQRT_252 = math.sqrt(_TRADING_DAYS)
+_RF_ANNUAL = 0.02
+_RF_DAILY = _RF_ANNUAL / _TRADING_DAYS
+
+# Series at least this long run the drawdown scan in float32 (half the memory
+# traffic; ~1e-7 relative error, far below reporting precision)
+_FLOAT32_DRAWDOWN_MIN_DAYS = 4096
+
+# Redis stream drained in batches by the worker's notification consumer;
+# XACK doesn't delete entries, so producers trim it like the outbox stream
+NOTIFICATION_STREAM = "notifications"
+NOTIFICATION_STREAM_MAXLEN = 10000
+
+SNAPSHOT_NOTIFICATION_TEMPLATE = (
+    "Valoración del portfolio '{portfolio_name}' actualizada. "
+    "Nuevo valor: ${total_value:,.2f}"
+)
+
+
+# First month of the quarter, indexed by month number (index 0 unused)
+_QSTART = (0, 1, 1, 1, 4, 4, 4, 7, 7, 7, 10, 10, 10)
+
+
+@lru_cache(maxsize=1)
+def _quarter_start(year: int, quarter_start_month: int) -> datetime:
+    """Return the start of a quarter; cached since it changes once a quarter."""
+    return datetime(year, quarter_start_month, 1)
+
+
+# Report templates: one process-wide environment so parsed templates stay cached
+_REPORT_TEMPLATES_DIR = Path(__file__).parent / "templates"
+_report_env = Environment(
+    loader=FileSystemLoader(str(_REPORT_TEMPLATES_DIR)),
+    autoescape=True,  # Enable autoescape to prevent XSS vulnerabilities
+    auto_reload=False,  # Templates ship with the package; skip mtime checks
+)
+
+
+@lru_cache(maxsize=1)
+def _weasyprint_font_config() -> Any:
+    """Return a shared WeasyPrint FontConfiguration (font discovery is costly)."""
+    from weasyprint.text.fonts import FontConfiguration
+
+    return FontConfiguration()
+
+
+def _to_decimal(value: Any) -> Decimal:
+    """Convert a numeric value to Decimal without binary float artifacts."""
+    return value if isinstance(value, Decimal) else Decimal(str(value))
+
 
 class SyncEvent(BaseModel):
     """Event model for SyncBridge communication"""
@@ -205,31 +272,35 @@ class PortfolioService:
                 last_updated=datetime.utcnow(),
             )
 
-        total_value = 0.0
-        total_cost_basis = 0.0
+        total_value = Decimal("0")
+        total_cost_basis = Decimal("0")
         positions_valued = 0
 
         for position in positions:
             try:
                 # Get current market price
-                current_price = self.market_data_provider.get_current_price(
-                    position.asset.ticker_symbol
+                current_price = _to_decimal(
+                    self.market_data_provider.get_current_price(
+                        position.asset.ticker_symbol
+                    )
                 )
 
-                # Calculate position values
-                position_market_value = position.quantity * current_price
-                position_cost_basis = position.quantity * position.purchase_price
+                # Calculate position values in exact decimal arithmetic
+                quantity = _to_decimal(position.quantity)
+                position_market_value = quantity * current_price
+                position_cost_basis = quantity * _to_decimal(position.purchase_price)
 
                 total_value += position_market_value
                 total_cost_basis += position_cost_basis
                 positions_valued += 1
 
                 logger.debug(
-                    f"Position {position.asset.ticker_symbol}: "
-                    f"Qty={position.quantity}, "
-                    f"Purchase=${position.purchase_price:.2f}, "
-                    f"Current=${current_price:.2f}, "
-                    f"Value=${position_market_value:.2f}"
+                    "position_valued",
+                    ticker=position.asset.ticker_symbol,
+                    quantity=position.quantity,
+                    purchase_price=position.purchase_price,
+                    current_price=current_price,
+                    market_value=position_market_value,
                 )
 
             except Exception as e:
@@ -243,29 +314,36 @@ class PortfolioService:
                     f"Failed to valuate position {position.asset.ticker_symbol}: {str(e)}"
                 )
 
-        # Calculate P&L
+        # Calculate P&L, quantizing once at the end
         total_pnl = total_value - total_cost_basis
         total_pnl_percentage = (
-            (total_pnl / total_cost_basis * 100) if total_cost_basis > 0 else 0.0
+            (total_pnl / total_cost_basis * 100)
+            if total_cost_basis > 0
+            else Decimal("0")
         )
 
+        total_value = total_value.quantize(CENTS)
+        total_cost_basis = total_cost_basis.quantize(CENTS)
+        total_pnl = total_pnl.quantize(CENTS)
+        total_pnl_percentage = total_pnl_percentage.quantize(CENTS)
+
         logger.info(
             "portfolio_valuation_completed",
             portfolio_id=portfolio_id,
-            total_value=round(total_value, 2),
-            total_cost_basis=round(total_cost_basis, 2),
-            total_pnl=round(total_pnl, 2),
-            total_pnl_percentage=round(total_pnl_percentage, 2),
+            total_value=total_value,
+            total_cost_basis=total_cost_basis,
+            total_pnl=total_pnl,
+            total_pnl_percentage=total_pnl_percentage,
             positions_valued=positions_valued,
         )
 
         return schemas.PortfolioValuation(
             portfolio_id=portfolio_id,
             portfolio_name=portfolio.name,
-            total_value=round(total_value, 2),
-            total_cost_basis=round(total_cost_basis, 2),
-            total_pnl=round(total_pnl, 2),
-            total_pnl_percentage=round(total_pnl_percentage, 2),
+            total_value=float(total_value),
+            total_cost_basis=float(total_cost_basis),
+            total_pnl=float(total_pnl),
+            total_pnl_percentage=float(total_pnl_percentage),
             positions_count=positions_valued,
             last_updated=datetime.utcnow(),
         )
@@ -283,7 +361,7 @@ class PortfolioService:
         Raises:
             ValueError: If portfolio not found or valuation fails
         """
-        logger.info(f"Creating snapshot for portfolio {portfolio_id}")
+        logger.info("portfolio_snapshot_started", portfolio_id=portfolio_id)
 
         try:
             # Get current portfolio valuation
@@ -292,14 +370,16 @@ class PortfolioService:
             # 🚀 CLEAN: Create snapshot through repository
             snapshot = self.portfolio_repo.create_snapshot(
                 portfolio_id=portfolio_id,
-                value=Decimal(str(valuation.total_value)),
+                value=_to_decimal(valuation.total_value).quantize(CENTS),
                 timestamp=datetime.utcnow(),
             )
 
             logger.info(
-                f"Snapshot created for portfolio {portfolio_id}: "
-                f"ID={snapshot.id}, Value=${snapshot.value}, "
-                f"Timestamp={snapshot.timestamp}"
+                "portfolio_snapshot_created",
+                portfolio_id=portfolio_id,
+                snapshot_id=snapshot.id,
+                value=snapshot.value,
+                timestamp=snapshot.timestamp,
             )
 
             # Create notification for the portfolio owner
@@ -308,12 +388,14 @@ class PortfolioService:
                 portfolio = self.portfolio_repo.get_by_id(portfolio_id)
                 if portfolio and portfolio.client:
                     owner_id = portfolio.client.owner_id
-                    portfolio_name = valuation.portfolio_name
-                    total_value = valuation.total_value
+                    DashboardService.invalidate_cached_dashboards(owner_id)
 
-                    self.notification_service.create_notification(
+                    self.notification_service.enqueue_notification(
                         user_id=owner_id,
-                        message=f"Valoración del portfolio '{portfolio_name}' actualizada. Nuevo valor: ${total_value:,.2f}",
+                        message=SNAPSHOT_NOTIFICATION_TEMPLATE.format(
+                            portfolio_name=valuation.portfolio_name,
+                            total_value=valuation.total_value,
+                        ),
                     )
             except Exception as e:
                 logger.warning(
@@ -329,6 +411,111 @@ class PortfolioService:
             )
             raise ValueError(f"Failed to create portfolio snapshot: {str(e)}")
 
+    def create_snapshots_for_portfolios(
+        self, portfolio_ids: list[int], prices: dict[str, float] | None = None
+    ) -> int:
+        """
+        Create snapshots for many portfolios with a single batched insert.
+
+        Portfolios are loaded in one query, all distinct tickers are priced
+        with one batch request, and all snapshots are written with one commit.
+        Portfolios whose positions cannot be priced are skipped and logged.
+
+        Args:
+            portfolio_ids: IDs of the portfolios to snapshot
+            prices: Optional prefetched ticker prices; only tickers missing
+                from it are requested from the market data provider
+
+        Returns:
+            Number of snapshots created
+        """
+        logger.info("portfolio_snapshots_started", portfolio_count=len(portfolio_ids))
+
+        portfolios = self.portfolio_repo.get_portfolios_with_positions(portfolio_ids)
+
+        known_prices = dict(prices or {})
+        missing_tickers = {
+            position.asset.ticker_symbol
+            for portfolio in portfolios
+            for position in portfolio.positions
+        }.difference(known_prices)
+        if missing_tickers:
+            known_prices.update(
+                self.market_data_provider.get_current_prices(sorted(missing_tickers))
+            )
+        decimal_prices: dict[str, Decimal] = {
+            ticker: _to_decimal(price) for ticker, price in known_prices.items()
+        }
+
+        values: dict[int, Decimal] = {}
+        for portfolio in portfolios:
+            try:
+                total_value = Decimal("0")
+                for position in portfolio.positions:
+                    ticker = position.asset.ticker_symbol
+                    if ticker not in decimal_prices:
+                        decimal_prices[ticker] = _to_decimal(
+                            self.market_data_provider.get_current_price(ticker)
+                        )
+                    total_value += (
+                        _to_decimal(position.quantity) * decimal_prices[ticker]
+                    )
+                values[portfolio.id] = total_value.quantize(CENTS)
+            except Exception as e:
+                logger.warning(
+                    "portfolio_snapshot_skipped",
+                    portfolio_id=portfolio.id,
+                    error=str(e),
+                )
+
+        try:
+            created = self.portfolio_repo.create_snapshots_bulk(
+                values, timestamp=datetime.utcnow()
+            )
+        except Exception as e:
+            self.portfolio_repo.session.rollback()
+            logger.error("portfolio_snapshots_failed", error=str(e))
+            raise ValueError(f"Failed to create portfolio snapshots: {str(e)}")
+
+        # Notify owners once the batch is committed
+        notified_owner_ids: set[int] = set()
+        notifications: list[tuple[int, str]] = []
+        for portfolio in portfolios:
+            if portfolio.id not in values or not portfolio.client:
+                continue
+            owner_id = portfolio.client.owner_id
+            try:
+                if owner_id not in notified_owner_ids:
+                    DashboardService.invalidate_cached_dashboards(owner_id)
+                    notified_owner_ids.add(owner_id)
+            except Exception as e:
+                logger.warning(
+                    "portfolio_snapshot_cache_invalidation_failed",
+                    portfolio_id=portfolio.id,
+                    error=str(e),
+                )
+            notifications.append(
+                (
+                    owner_id,
+                    SNAPSHOT_NOTIFICATION_TEMPLATE.format(
+                        portfolio_name=portfolio.name,
+                        total_value=values[portfolio.id],
+                    ),
+                )
+            )
+
+        try:
+            self.notification_service.enqueue_notifications(notifications)
+        except Exception as e:
+            logger.warning(
+                "portfolio_snapshot_notification_failed",
+                notification_count=len(notifications),
+                error=str(e),
+            )
+
+        logger.info("portfolio_snapshots_completed", snapshots_created=created)
+        return created
+
 
 class ReportService:
     """Service class for generating PDF reports."""
@@ -346,13 +533,8 @@ class ReportService:
         self.notification_service = NotificationService(db_session)
         self.portfolio_service = PortfolioService(db_session, market_data_provider)
 
-        # Setup Jinja2 template environment with autoescape enabled for security
-        current_dir = Path(__file__).parent
-        templates_dir = current_dir / "templates"
-        self.env = Environment(
-            loader=FileSystemLoader(str(templates_dir)),
-            autoescape=True,  # Enable autoescape to prevent XSS vulnerabilities
-        )
+        # Shared Jinja2 environment (autoescape on); compiled templates are reused
+        self.env = _report_env
 
     def generate_portfolio_report_pdf(
         self, valuation_data: schemas.PortfolioValuation, portfolio_name: str
@@ -462,14 +644,12 @@ class ReportService:
             logger.info("Converting HTML to PDF using WeasyPrint")
 
             # Get the base URL for CSS resolution
-            current_dir = Path(__file__).parent
-            templates_dir = current_dir / "templates"
-            base_url = f"file://{templates_dir}/"
+            base_url = f"file://{_REPORT_TEMPLATES_DIR}/"
 
-            # Generate PDF
+            # Generate PDF, reusing the font configuration across reports
             pdf_bytes = weasyprint.HTML(
                 string=html_content, base_url=base_url
-            ).write_pdf()
+            ).write_pdf(font_config=_weasyprint_font_config())
 
             logger.info(
                 f"PDF report generated successfully for portfolio {valuation_data.portfolio_id}. "
@@ -547,9 +727,9 @@ class ReportService:
             filename = f"report_{client_id}_{timestamp}.pdf"
             file_path = reports_dir / filename
 
-            # 7. Save PDF to file
-            with open(file_path, "wb") as f:
-                f.write(pdf_bytes)
+            # 7. Save PDF to file without blocking the event loop
+            async with aiofiles.open(file_path, "wb") as f:
+                await f.write(pdf_bytes)
 
             logger.info(f"PDF saved to {file_path}")
 
@@ -603,12 +783,14 @@ class DashboardService:
     Optimized service for dashboard calculations with Redis caching.
 
     Features:
-    - Redis-based caching with 5-minute TTL for dashboard data
+    - Redis-based caching with a short TTL, invalidated on new snapshots
     - Optimized database queries with eager loading
     - Role-based data filtering
     - Efficient AUM calculations
     """
 
+    CACHE_TTL_SECONDS = 30
+
     def __init__(self, db_session: Session, market_data_provider=None):
         """
         Initialize the dashboard service.
@@ -641,16 +823,40 @@ class DashboardService:
         return None
 
     def _cache_dashboard(self, user_id: int, user_role: str, data: dict) -> None:
-        """Cache dashboard data for 5 minutes."""
+        """Cache dashboard data for CACHE_TTL_SECONDS."""
         if not REDIS_AVAILABLE:
             return
 
         try:
             cache_key = self._get_cache_key(user_id, user_role)
-            redis_client.setex(cache_key, 300, json.dumps(data))  # 5 minutes TTL
+            redis_client.setex(cache_key, self.CACHE_TTL_SECONDS, json.dumps(data))
         except Exception as e:
             logger.warning(f"Failed to cache dashboard: {e}")
 
+    @staticmethod
+    def invalidate_cached_dashboards(owner_id: int) -> None:
+        """
+        Drop cached dashboards affected by a change to an advisor's portfolios.
+
+        Removes the owner's own summaries plus every admin summary, since
+        admins aggregate across all portfolios.
+        """
+        if not REDIS_AVAILABLE:
+            return
+
+        try:
+            patterns = (
+                f"dashboard:summary:{owner_id}:*",
+                f"dashboard:summary:*:{UserRole.ADMIN.value}",
+            )
+            stale_keys = {
+                key for pattern in patterns for key in redis_client.scan_iter(pattern)
+            }
+            if stale_keys:
+                redis_client.unlink(*stale_keys)
+        except Exception as e:
+            logger.warning(f"Failed to invalidate dashboard cache: {e}")
+
     def get_dashboard_summary(self, user: User) -> schemas.DashboardSummaryResponse:
         """
         Calculate dashboard KPIs with caching and optimized queries.
@@ -679,21 +885,23 @@ class DashboardService:
 
         # 1. Total Clients Count - Optimized query
         total_clients = len(self.db.exec(clients_query).all())
-        logger.debug(f"Total clients: {total_clients}")
+        logger.debug("dashboard_total_clients", total_clients=total_clients)
 
         # 2. Assets Under Management (AUM) - Optimized calculation
         aum = self._calculate_assets_under_management_optimized(user)
-        logger.debug(f"Assets under management: ${aum:.2f}")
+        logger.debug("dashboard_aum", assets_under_management=aum)
 
         # 3. Monthly Growth Percentage - Real implementation
         monthly_growth = self._calculate_monthly_growth(user)
-        logger.debug(f"Monthly growth calculation: {monthly_growth}")
+        logger.debug("dashboard_monthly_growth", monthly_growth=monthly_growth)
 
         # 4. Reports Generated This Quarter - Optimized query
         reports_generated = self._calculate_reports_generated_this_quarter_optimized(
             user
         )
-        logger.debug(f"Reports generated this quarter: {reports_generated}")
+        logger.debug(
+            "dashboard_reports_this_quarter", reports_generated=reports_generated
+        )
 
         dashboard_summary = schemas.DashboardSummaryResponse(
             total_clients=total_clients,
@@ -741,7 +949,7 @@ class DashboardService:
         try:
             # Calculate quarter boundaries
             now = datetime.utcnow()
-            quarter_start = datetime(now.year, ((now.month - 1) // 3) * 3 + 1, 1)
+            quarter_start = _quarter_start(now.year, _QSTART[now.month])
 
             # Build optimized query
             reports_query = (
@@ -772,82 +980,68 @@ class DashboardService:
             Monthly growth as decimal (0.082 for 8.2%) or None if insufficient data
         """
         try:
-            from datetime import datetime
-
             # Calculate current month start date
             now = datetime.now(UTC)
             current_month_start = datetime(now.year, now.month, 1, tzinfo=UTC)
 
-            # Get portfolios based on user role
-            portfolios_query = select(Portfolio).join(Client)
+            # Rank snapshots per portfolio twice in a single CTE: rn_now picks the
+            # latest snapshot overall, rn_prev the latest one at or before month
+            # start (partitioning on the month-start flag keeps both in one scan)
+            is_before_month_start = PortfolioSnapshot.timestamp <= current_month_start
+            ranked_snapshots_query = (
+                select(
+                    PortfolioSnapshot.value,
+                    is_before_month_start.label("before_month_start"),
+                    func.row_number()
+                    .over(
+                        partition_by=PortfolioSnapshot.portfolio_id,
+                        order_by=PortfolioSnapshot.timestamp.desc(),
+                    )
+                    .label("rn_now"),
+                    func.row_number()
+                    .over(
+                        partition_by=(
+                            PortfolioSnapshot.portfolio_id,
+                            is_before_month_start,
+                        ),
+                        order_by=PortfolioSnapshot.timestamp.desc(),
+                    )
+                    .label("rn_prev"),
+                )
+                .join(Portfolio, PortfolioSnapshot.portfolio_id == Portfolio.id)
+                .join(Client, Portfolio.client_id == Client.id)
+            )
             if user.role != UserRole.ADMIN:
                 # Non-admin users only see portfolios of their assigned clients
-                portfolios_query = portfolios_query.where(Client.owner_id == user.id)
-
-            portfolios = self.db.exec(portfolios_query).all()
-
-            if not portfolios:
-                logger.warning(f"No portfolios found for user {user.id}")
-                return None
-
-            portfolio_ids = [p.id for p in portfolios]
-
-            # Get current AUM from most recent snapshots
-            current_snapshots_query = (
-                select(
-                    PortfolioSnapshot.portfolio_id,
-                    func.max(PortfolioSnapshot.timestamp).label("latest_timestamp"),
+                ranked_snapshots_query = ranked_snapshots_query.where(
+                    Client.owner_id == user.id
                 )
-                .where(PortfolioSnapshot.portfolio_id.in_(portfolio_ids))
-                .group_by(PortfolioSnapshot.portfolio_id)
-            ).subquery()
 
-            current_aum_query = select(func.sum(PortfolioSnapshot.value)).join(
-                current_snapshots_query,
-                (
-                    PortfolioSnapshot.portfolio_id
-                    == current_snapshots_query.c.portfolio_id
-                )
-                & (
-                    PortfolioSnapshot.timestamp
-                    == current_snapshots_query.c.latest_timestamp
+            ranked_snapshots = ranked_snapshots_query.cte("ranked_snapshots")
+
+            aum_query = select(
+                func.sum(
+                    case((ranked_snapshots.c.rn_now == 1, ranked_snapshots.c.value))
+                ),
+                func.sum(
+                    case(
+                        (
+                            and_(
+                                ranked_snapshots.c.rn_prev == 1,
+                                ranked_snapshots.c.before_month_start,
+                            ),
+                            ranked_snapshots.c.value,
+                        )
+                    )
                 ),
             )
 
-            current_aum = self.db.exec(current_aum_query).first()
+            current_aum, start_of_month_aum = self.db.exec(aum_query).one()
 
             if not current_aum or current_aum == 0:
                 logger.warning(f"No current AUM data found for user {user.id}")
                 return None
 
-            # Get start-of-month AUM from snapshots closest to month start
-            # Find the latest snapshot before or at the start of current month for each portfolio
-            month_start_snapshots_query = (
-                select(
-                    PortfolioSnapshot.portfolio_id,
-                    func.max(PortfolioSnapshot.timestamp).label(
-                        "month_start_timestamp"
-                    ),
-                )
-                .where(PortfolioSnapshot.portfolio_id.in_(portfolio_ids))
-                .where(PortfolioSnapshot.timestamp <= current_month_start)
-                .group_by(PortfolioSnapshot.portfolio_id)
-            ).subquery()
-
-            start_of_month_aum_query = select(func.sum(PortfolioSnapshot.value)).join(
-                month_start_snapshots_query,
-                (
-                    PortfolioSnapshot.portfolio_id
-                    == month_start_snapshots_query.c.portfolio_id
-                )
-                & (
-                    PortfolioSnapshot.timestamp
-                    == month_start_snapshots_query.c.month_start_timestamp
-                ),
-            )
-
-            start_of_month_aum = self.db.exec(start_of_month_aum_query).first()
-
             if not start_of_month_aum or start_of_month_aum == 0:
                 logger.warning(f"No start-of-month AUM data found for user {user.id}")
                 return None
@@ -892,8 +1086,6 @@ class DashboardService:
         """
         try:
             # Initialize portfolio repository
-            from .repositories.portfolio_repository import PortfolioRepository
-
             portfolio_repo = PortfolioRepository(self.db)
 
             # Determine advisor_id based on user role
@@ -924,12 +1116,77 @@ class DashboardService:
 # ============ INVESTMENT ACCOUNT SERVICE ============
 
 
+def _select_authorized_client_ids(
+    session: Session, client_ids: Iterable[int], current_advisor: User
+) -> frozenset[int]:
+    """
+    Return the subset of client IDs the advisor may access, in one query.
+
+    ADMIN users may access every existing client; other users only the
+    clients they own.
+    """
+    statement = select(Client.id).where(Client.id.in_(list(client_ids)))
+    if current_advisor.role != UserRole.ADMIN:
+        statement = statement.where(Client.owner_id == current_advisor.id)
+    return frozenset(session.exec(statement).all())
+
+
+def _verify_clients_access(
+    session: Session,
+    client_ids: Iterable[int],
+    current_advisor: User,
+    authorized_client_ids: dict[int, set[int]],
+    noun: str,
+) -> frozenset[int]:
+    """
+    Verify access to several clients with a single query.
+
+    Authorized IDs are remembered in authorized_client_ids, which the calling
+    service keeps for its lifetime (one request), so repeated checks skip
+    the database.
+
+    Args:
+        session: Database session
+        client_ids: IDs of the clients
+        current_advisor: Current authenticated advisor
+        authorized_client_ids: Per-advisor cache of verified client IDs
+        noun: What the advisor manages, used in the access denied message
+
+    Returns:
+        The verified client IDs
+
+    Raises:
+        HTTPException: If any client is not found or not accessible
+    """
+    requested = set(client_ids)
+    authorized = authorized_client_ids.setdefault(current_advisor.id, set())
+
+    if requested - authorized:
+        authorized |= _select_authorized_client_ids(
+            session, requested - authorized, current_advisor
+        )
+
+    if requested - authorized:
+        # ADMIN users can access any client, so a miss means it doesn't exist
+        if current_advisor.role == UserRole.ADMIN:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND, detail="Client not found"
+            )
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail=f"Access denied. You can only manage {noun} for your own clients.",
+        )
+
+    return frozenset(requested)
+
+
 class InvestmentAccountService:
     """Service class for Investment Account business logic with authorization."""
 
     def __init__(self, db_session: Session):
         """Initialize the investment account service."""
         self.db = db_session
+        self._authorized_client_ids: dict[int, set[int]] = {}
 
     def create_account_for_client(
         self,
@@ -961,7 +1218,7 @@ class InvestmentAccountService:
             )
         except Exception as e:
             logger.error(
-                f"Failed to create investment account for client {client_id}: {str(e)}"
+                "investment_account_creation_failed", client_id=client_id, error=str(e)
             )
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
@@ -982,33 +1239,50 @@ class InvestmentAccountService:
         Raises:
             HTTPException: If authorization fails or account not found
         """
-        # Get the account
-        account = crud.get_investment_account(session=self.db, account_id=account_id)
-        if not account:
+        # Fetch the account and enforce client ownership in a single query
+        owner_id = (
+            None if current_advisor.role == UserRole.ADMIN else current_advisor.id
+        )
+        account = crud.get_account_if_owned(
+            session=self.db, account_id=account_id, owner_id=owner_id
+        )
+        if account:
+            self._authorized_client_ids.setdefault(current_advisor.id, set()).add(
+                account.client_id
+            )
+            return account
+
+        # Rare miss path: tell a missing account apart from a foreign one
+        if owner_id is None or not crud.get_investment_account(
+            session=self.db, account_id=account_id
+        ):
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="Investment account not found",
             )
-
-        # Verify client ownership/access through the account's client
-        self._verify_client_access(account.client_id, current_advisor)
-
-        return account
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Access denied. You can only manage accounts for your own clients.",
+        )
 
     def get_accounts_by_client(
-        self, client_id: int, current_advisor: User, skip: int = 0, limit: int = 100
-    ) -> list[InvestmentAccount]:
+        self,
+        client_id: int,
+        current_advisor: User,
+        cursor: int | None = None,
+        limit: int = 100,
+    ) -> tuple[list[InvestmentAccount], int | None]:
         """
-        Get all investment accounts for a client with proper authorization.
+        Get a page of investment accounts for a client with proper authorization.
 
         Args:
             client_id: ID of the client
             current_advisor: Current authenticated advisor
-            skip: Number of records to skip
+            cursor: ID of the last record from the previous page
             limit: Maximum number of records to return
 
         Returns:
-            List of InvestmentAccount instances
+            Tuple of (list of InvestmentAccount instances, next page cursor or None)
 
         Raises:
             HTTPException: If authorization fails or client not found
@@ -1017,7 +1291,7 @@ class InvestmentAccountService:
         self._verify_client_access(client_id, current_advisor)
 
         return crud.get_investment_accounts_by_client(
-            session=self.db, client_id=client_id, skip=skip, limit=limit
+            session=self.db, client_id=client_id, cursor=cursor, limit=limit
         )
 
     def update_account(
@@ -1048,7 +1322,9 @@ class InvestmentAccountService:
                 session=self.db, account_db_obj=account, update_data=update_data
             )
         except Exception as e:
-            logger.error(f"Failed to update investment account {account_id}: {str(e)}")
+            logger.error(
+                "investment_account_update_failed", account_id=account_id, error=str(e)
+            )
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail=f"Failed to update investment account: {str(e)}",
@@ -1087,12 +1363,6 @@ class InvestmentAccountService:
     def bulk_upload_investment_accounts(
         self, client_id: int, file: UploadFile, current_advisor: User
     ):
-        from io import BytesIO
-
-        import pandas as pd
-        from .models import InvestmentAccount
-        from .schemas import InvestmentAccountCreate
-
         # Leer archivo Excel o CSV
         content = file.file.read()
         try:
@@ -1129,7 +1399,7 @@ class InvestmentAccountService:
                 updated += 1
             else:
                 # Crear nueva cuenta
-                data = InvestmentAccountCreate(
+                data = schemas.InvestmentAccountCreate(
                     platform=str(row["platform"]),
                     account_number=str(row["account_number"]),
                     aum=row["aum"],
@@ -1153,7 +1423,7 @@ class InvestmentAccountService:
             "total": len(df),
         }
 
-    def _verify_client_access(self, client_id: int, current_advisor: User) -> Client:
+    def _verify_client_access(self, client_id: int, current_advisor: User) -> None:
         """
         Verify that the current advisor has access to the specified client.
 
@@ -1161,37 +1431,16 @@ class InvestmentAccountService:
             client_id: ID of the client
             current_advisor: Current authenticated advisor
 
-        Returns:
-            Client instance if access is granted
-
         Raises:
             HTTPException: If authorization fails or client not found
         """
-        # ADMIN users can access any client
-        if current_advisor.role == UserRole.ADMIN:
-            client = crud.get_client(
-                session=self.db, client_id=client_id, owner_id=None
-            )
-            if not client:
-                # For ADMIN, we need to check without owner restriction
-                client = self.db.get(Client, client_id)
-            if not client:
-                raise HTTPException(
-                    status_code=status.HTTP_404_NOT_FOUND, detail="Client not found"
-                )
-            return client
-
-        # Non-ADMIN users can only access their own clients
-        client = crud.get_client(
-            session=self.db, client_id=client_id, owner_id=current_advisor.id
+        _verify_clients_access(
+            self.db,
+            [client_id],
+            current_advisor,
+            self._authorized_client_ids,
+            noun="accounts",
         )
-        if not client:
-            raise HTTPException(
-                status_code=status.HTTP_403_FORBIDDEN,
-                detail="Access denied. You can only manage accounts for your own clients.",
-            )
-
-        return client
 
 
 # ============ INSURANCE POLICY SERVICE ============
@@ -1203,6 +1452,7 @@ class InsurancePolicyService:
     def __init__(self, db_session: Session):
         """Initialize the insurance policy service."""
         self.db = db_session
+        self._authorized_client_ids: dict[int, set[int]] = {}
 
     def create_policy_for_client(
         self,
@@ -1237,7 +1487,7 @@ class InsurancePolicyService:
             raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
         except Exception as e:
             logger.error(
-                f"Failed to create insurance policy for client {client_id}: {str(e)}"
+                "insurance_policy_creation_failed", client_id=client_id, error=str(e)
             )
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
@@ -1258,33 +1508,50 @@ class InsurancePolicyService:
         Raises:
             HTTPException: If authorization fails or policy not found
         """
-        # Get the policy
-        policy = crud.get_insurance_policy(session=self.db, policy_id=policy_id)
-        if not policy:
+        # Fetch the policy and enforce client ownership in a single query
+        owner_id = (
+            None if current_advisor.role == UserRole.ADMIN else current_advisor.id
+        )
+        policy = crud.get_policy_if_owned(
+            session=self.db, policy_id=policy_id, owner_id=owner_id
+        )
+        if policy:
+            self._authorized_client_ids.setdefault(current_advisor.id, set()).add(
+                policy.client_id
+            )
+            return policy
+
+        # Rare miss path: tell a missing policy apart from a foreign one
+        if owner_id is None or not crud.get_insurance_policy(
+            session=self.db, policy_id=policy_id
+        ):
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="Insurance policy not found",
             )
-
-        # Verify client ownership/access through the policy's client
-        self._verify_client_access(policy.client_id, current_advisor)
-
-        return policy
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Access denied. You can only manage policies for your own clients.",
+        )
 
     def get_policies_by_client(
-        self, client_id: int, current_advisor: User, skip: int = 0, limit: int = 100
-    ) -> list[InsurancePolicy]:
+        self,
+        client_id: int,
+        current_advisor: User,
+        cursor: int | None = None,
+        limit: int = 100,
+    ) -> tuple[list[InsurancePolicy], int | None]:
         """
-        Get all insurance policies for a client with proper authorization.
+        Get a page of insurance policies for a client with proper authorization.
 
         Args:
             client_id: ID of the client
             current_advisor: Current authenticated advisor
-            skip: Number of records to skip
+            cursor: ID of the last record from the previous page
             limit: Maximum number of records to return
 
         Returns:
-            List of InsurancePolicy instances
+            Tuple of (list of InsurancePolicy instances, next page cursor or None)
 
         Raises:
             HTTPException: If authorization fails or client not found
@@ -1293,7 +1560,7 @@ class InsurancePolicyService:
         self._verify_client_access(client_id, current_advisor)
 
         return crud.get_insurance_policies_by_client(
-            session=self.db, client_id=client_id, skip=skip, limit=limit
+            session=self.db, client_id=client_id, cursor=cursor, limit=limit
         )
 
     def update_policy(
@@ -1327,7 +1594,9 @@ class InsurancePolicyService:
             # Policy number conflict
             raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
         except Exception as e:
-            logger.error(f"Failed to update insurance policy {policy_id}: {str(e)}")
+            logger.error(
+                "insurance_policy_update_failed", policy_id=policy_id, error=str(e)
+            )
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail=f"Failed to update insurance policy: {str(e)}",
@@ -1361,7 +1630,7 @@ class InsurancePolicyService:
 
         return deleted_policy
 
-    def _verify_client_access(self, client_id: int, current_advisor: User) -> Client:
+    def _verify_client_access(self, client_id: int, current_advisor: User) -> None:
         """
         Verify that the current advisor has access to the specified client.
 
@@ -1369,37 +1638,16 @@ class InsurancePolicyService:
             client_id: ID of the client
             current_advisor: Current authenticated advisor
 
-        Returns:
-            Client instance if access is granted
-
         Raises:
             HTTPException: If authorization fails or client not found
         """
-        # ADMIN users can access any client
-        if current_advisor.role == UserRole.ADMIN:
-            client = crud.get_client(
-                session=self.db, client_id=client_id, owner_id=None
-            )
-            if not client:
-                # For ADMIN, we need to check without owner restriction
-                client = self.db.get(Client, client_id)
-            if not client:
-                raise HTTPException(
-                    status_code=status.HTTP_404_NOT_FOUND, detail="Client not found"
-                )
-            return client
-
-        # Non-ADMIN users can only access their own clients
-        client = crud.get_client(
-            session=self.db, client_id=client_id, owner_id=current_advisor.id
+        _verify_clients_access(
+            self.db,
+            [client_id],
+            current_advisor,
+            self._authorized_client_ids,
+            noun="policies",
         )
-        if not client:
-            raise HTTPException(
-                status_code=status.HTTP_403_FORBIDDEN,
-                detail="Access denied. You can only manage policies for your own clients.",
-            )
-
-        return client
 
 
 class NotificationService:
@@ -1410,8 +1658,6 @@ class NotificationService:
     def __init__(self, db_session: Session):
         """Initialize the notification service."""
         self.db = db_session
-        from .repositories.notification_repository import NotificationRepository
-
         self.notification_repo = NotificationRepository(db_session)
 
     def create_notification(self, user_id: int, message: str) -> Notification:
@@ -1426,34 +1672,171 @@ class NotificationService:
             The created Notification object
         """
         logger.info("notification_creation_started", user_id=user_id, message=message)
+        return self.create_notifications([(user_id, message)])[0]
+
+    def create_notifications(self, items: list[tuple[int, str]]) -> list[Notification]:
+        """
+        Create several notifications with a single commit and send them in real-time.
+
+        Args:
+            items: (user_id, message) pairs to notify
+
+        Returns:
+            The created Notification objects
+        """
+        if not items:
+            return []
 
-        # Create notification in the database
-        notification = Notification(user_id=user_id, message=message)
-        notification = self.notification_repo.create(notification)
+        # Create notifications in the database; the flush assigns ids, and the
+        # commit waits until the payloads are read so committing doesn't expire
+        # them (no per-row refresh)
+        notifications = self.notification_repo.create_many(
+            [
+                Notification(user_id=user_id, message=message)
+                for user_id, message in items
+            ],
+            commit=False,
+        )
+
+        # ✅ FIX: Pass primitive types to the async task to prevent DetachedInstanceError.
+        # The session that created the `notification` object may close before the task runs.
+        # By passing primitive data, we decouple the task from the session.
+        payloads = [
+            self.realtime_payload(notification) for notification in notifications
+        ]
+        self.db.commit()
 
-        # 🚀 REAL-TIME: Send notification via WebSocket
-        # We use asyncio.create_task to send the notification without
+        # 🚀 REAL-TIME: Send notifications via WebSocket
+        # We use asyncio.create_task to send the notifications without
         # blocking the main thread.
-        try:
-            # ✅ FIX: Pass primitive types to the async task to prevent DetachedInstanceError.
-            # The session that created the `notification` object may close before the task runs.
-            # By passing primitive data, we decouple the task from the session.
-            asyncio.create_task(
-                self._send_realtime_notification(
-                    user_id=notification.user_id,
-                    message=notification.message,
-                    notification_id=notification.id,
-                    read_status=notification.read,
-                    created_iso=notification.created_at.isoformat(),
+        for payload in payloads:
+            try:
+                asyncio.create_task(self._send_realtime_notification(**payload))
+                logger.info(
+                    "realtime_notification_task_created",
+                    notification_id=payload["notification_id"],
                 )
+            except Exception as e:
+                logger.error("realtime_notification_dispatch_failed", error=str(e))
+
+        return notifications
+
+    @staticmethod
+    def realtime_payload(notification: Notification) -> dict[str, Any]:
+        """
+        Extract the primitive fields sent over WebSocket for a notification.
+
+        Args:
+            notification: A flushed notification (its id must be assigned)
+
+        Returns:
+            Keyword arguments for _send_realtime_notification
+        """
+        return {
+            "user_id": notification.user_id,
+            "message": notification.message,
+            "notification_id": notification.id,
+            "read_status": notification.is_read,
+            "created_iso": notification.created_at.isoformat(),
+        }
+
+    @classmethod
+    async def send_realtime_notifications(cls, payloads: list[dict[str, Any]]) -> None:
+        """
+        Send already persisted notifications via WebSocket.
+
+        Args:
+            payloads: Payloads built with realtime_payload
+        """
+        await asyncio.gather(
+            *(cls._send_realtime_notification(**payload) for payload in payloads)
+        )
+
+    def enqueue_notification(self, user_id: int, message: str) -> None:
+        """
+        Queue a notification on the Redis stream for batched persistence.
+
+        The worker drains the stream and inserts notifications in batches,
+        so hot paths pay for a single XADD instead of a DB write and commit.
+        Falls back to create_notification when Redis is unavailable.
+
+        Args:
+            user_id: ID of the user to notify
+            message: Notification message
+        """
+        if REDIS_AVAILABLE:
+            try:
+                redis_client.xadd(
+                    NOTIFICATION_STREAM,
+                    {"user_id": user_id, "message": message},
+                    maxlen=NOTIFICATION_STREAM_MAXLEN,
+                    approximate=True,
+                )
+                logger.debug("notification_enqueued", user_id=user_id)
+                return
+            except Exception as e:
+                logger.warning("notification_enqueue_failed", error=str(e))
+
+        self.create_notification(user_id=user_id, message=message)
+
+    def enqueue_notifications(self, items: list[tuple[int, str]]) -> None:
+        """
+        Queue several notifications on the Redis stream in one round trip.
+
+        All XADDs are sent through a single non-transactional pipeline. Falls
+        back to create_notifications (one batched commit) when Redis is
+        unavailable, and for just the items whose XADD failed otherwise, so
+        entries already on the stream are never inserted twice.
+
+        Args:
+            items: (user_id, message) pairs to notify
+        """
+        if not items:
+            return
+
+        if not REDIS_AVAILABLE:
+            self.create_notifications(items)
+            return
+
+        pipe = redis_client.pipeline(transaction=False)
+        for user_id, message in items:
+            pipe.xadd(
+                NOTIFICATION_STREAM,
+                {"user_id": user_id, "message": message},
+                maxlen=NOTIFICATION_STREAM_MAXLEN,
+                approximate=True,
             )
-            logger.info(
-                "realtime_notification_task_created", notification_id=notification.id
-            )
+
+        try:
+            results = pipe.execute(raise_on_error=False)
+        except redis.ConnectionError as e:
+            # The connection couldn't be used, so no XADD reached the stream
+            logger.warning("notification_enqueue_failed", error=str(e))
+            self.create_notifications(items)
+            return
         except Exception as e:
-            logger.error("realtime_notification_dispatch_failed", error=str(e))
+            # Some XADDs may already be on the stream; re-inserting the batch
+            # would duplicate them
+            logger.error(
+                "notification_enqueue_outcome_unknown",
+                notification_count=len(items),
+                error=str(e),
+            )
+            return
 
-        return notification
+        failed = [
+            item
+            for item, result in zip(items, results)
+            if isinstance(result, Exception)
+        ]
+        if failed:
+            logger.warning(
+                "notification_enqueue_partially_failed",
+                failed_count=len(failed),
+                error=str(next(r for r in results if isinstance(r, Exception))),
+            )
+            self.create_notifications(failed)
+        logger.debug("notifications_enqueued", count=len(items) - len(failed))
 
     async def create_notification_async(
         self, user_id: int, message: str
@@ -1488,8 +1871,8 @@ class NotificationService:
 
         return notification
 
+    @staticmethod
     async def _send_realtime_notification(
-        self,
         user_id: int,
         message: str,
         notification_id: int,
@@ -1549,8 +1932,18 @@ class PortfolioBacktestService:
     - 100% data integrity from yfinance
     """
 
-    def __init__(self):
-        """Initialize the optimized backtest service with Redis connection."""
+    CACHE_TTL_SECONDS = 86400  # 24h
+    PRICE_ONLY_PERIODS = frozenset({"1d", "5d"})
+
+    def __init__(self, redis_client: aioredis.Redis | None = None):
+        """
+        Initialize the optimized backtest service.
+
+        Args:
+            redis_client: asyncio Redis client for the cache tier, owned by the
+                caller (the app lifespan); None skips Redis and uses only the
+                disk cache
+        """
         self.period_mapping = {
             "1d": "1d",
             "5d": "5d",
@@ -1565,16 +1958,10 @@ class PortfolioBacktestService:
             "max": "max",
         }
 
-        # Initialize Redis connection
-        try:
-            self.redis_client = redis.from_url(
-                settings.REDIS_URL, decode_responses=True
-            )
-            self.redis_client.ping()  # Test connection
-            logger.info("Redis connection established for backtesting cache")
-        except Exception as e:
-            logger.warning(f"Redis connection failed: {e}. Operating without cache.")
-            self.redis_client = None
+        # asyncio Redis client so cache I/O never blocks the event loop
+        self.redis_client = redis_client
+        # Second-tier file cache consulted on Redis misses (None disables it)
+        self.disk_cache_dir: Path | None = BACKTEST_DISK_CACHE_DIR
 
     def _ensure_timezone_aware(
         self, target_date: datetime, reference_index: pd.DatetimeIndex
@@ -1651,14 +2038,22 @@ class PortfolioBacktestService:
                     "No historical data available for the selected tickers and period"
                 )
 
-            # Download dividend data concurrently
-            dividend_data = await self._download_dividend_data_concurrent(
-                all_tickers, request.period
-            )
+            # Download dividend data concurrently; one- and five-day periods
+            # have no meaningful dividend events, so skip the lookups entirely
+            if request.period in self.PRICE_ONLY_PERIODS:
+                dividend_data = {}
+            else:
+                dividend_data = await self._download_dividend_data_concurrent(
+                    all_tickers, request.period
+                )
+
+            # Compute daily returns once for every ticker; portfolio and
+            # benchmark calculations slice this shared matrix
+            asset_returns = hist_data.pct_change().fillna(0)
 
             # Calculate portfolio performance using daily returns
             portfolio_daily_returns = self._calculate_portfolio_daily_returns(
-                hist_data, request.composition, portfolio_tickers
+                hist_data, request.composition, portfolio_tickers, asset_returns
             )
 
             # Calculate portfolio cumulative returns for visualization
@@ -1668,7 +2063,7 @@ class PortfolioBacktestService:
 
             # Calculate benchmark returns
             benchmark_returns = self._calculate_benchmark_returns(
-                hist_data, request.benchmarks
+                hist_data, request.benchmarks, asset_returns
             )
 
             # Generate data points for visualization
@@ -1691,81 +2086,239 @@ class PortfolioBacktestService:
             )
 
         except Exception as e:
-            logger.error(f"Backtesting error: {str(e)}")
+            logger.error("backtest_failed", error=str(e))
             raise ValueError(f"Failed to perform backtest: {str(e)}")
 
     def _generate_cache_key(
         self, ticker: str, period: str, data_type: str = "prices"
     ) -> str:
         """Generate unique cache key for ticker data."""
-        key_string = f"{data_type}:{ticker}:{period}"
-        # Use SHA-256 instead of MD5 for better security (not used for cryptographic purposes)
-        return f"yfinance:{hashlib.sha256(key_string.encode()).hexdigest()}"
+        # Plain keys are already unique; hashing them only costs CPU
+        return f"yfinance:{data_type}:{ticker}:{period}"
+
+    @staticmethod
+    def _encode_series(series: pd.Series) -> bytes:
+        """
+        Encode a daily series as raw NumPy buffers for the Redis cache.
+
+        Layout: format byte, then int64 nanosecond dates, then float64 values.
+        Dates are reduced to naive midnight, matching the daily granularity
+        the backtest works at.
+        """
+        index = pd.DatetimeIndex(series.index)
+        if index.tz is not None:
+            index = index.tz_localize(None)
+        dates = index.normalize().values.astype("datetime64[ns]").view(np.int64)
+        values = series.to_numpy(dtype=np.float64)
+        return _SERIES_CACHE_FORMAT + dates.tobytes() + values.tobytes()
+
+    @staticmethod
+    def _decode_series(payload: bytes) -> pd.Series:
+        """Decode a series written by _encode_series."""
+        if payload[:1] != _SERIES_CACHE_FORMAT:
+            raise ValueError("Unrecognized cache entry format")
+
+        buffer = memoryview(payload)[1:]
+        length = len(buffer) // 16
+        dates = np.frombuffer(buffer[: length * 8], dtype=np.int64)
+        values = np.frombuffer(buffer[length * 8 :], dtype=np.float64)
+        return pd.Series(
+            values, index=pd.DatetimeIndex(dates.view("datetime64[ns]")), dtype=float
+        )
+
+    @staticmethod
+    def _extract_close_prices(data: pd.DataFrame, ticker: str) -> pd.Series:
+        """
+        Pull one ticker's close prices out of a yf.download result.
+
+        Handles both the per-ticker column MultiIndex of a multi-ticker
+        download and the flat columns yfinance may return for one ticker.
+        """
+        if data.empty:
+            return pd.Series(dtype=float)
+
+        if isinstance(data.columns, pd.MultiIndex):
+            if ticker in data.columns.get_level_values(0):
+                close_prices = data[ticker]["Close"]
+            elif ticker in data.columns.get_level_values(-1):
+                close_prices = data["Close"][ticker]
+            else:
+                return pd.Series(dtype=float)
+        else:
+            close_prices = data["Close"]
+
+        # Ensure close_prices is a Series (in case yfinance returns DataFrame)
+        if isinstance(close_prices, pd.DataFrame):
+            close_prices = close_prices.squeeze(axis=1)
+
+        # Multi-ticker downloads align calendars, leaving gaps per ticker
+        return close_prices.dropna()
+
+    async def _cache_get_many(self, cache_keys: list[str]) -> list[bytes | None]:
+        """Read several cache entries in a single MGET round trip."""
+        if not self.redis_client or not cache_keys:
+            return [None] * len(cache_keys)
+
+        try:
+            return list(await self.redis_client.mget(cache_keys))
+        except Exception as e:
+            logger.warning("backtest_cache_read_failed", error=str(e))
+            return [None] * len(cache_keys)
+
+    async def _cache_set_many(self, entries: dict[str, bytes]) -> None:
+        """Write several cache entries in a single pipelined round trip."""
+        if not self.redis_client or not entries:
+            return
+
+        try:
+            pipe = self.redis_client.pipeline(transaction=False)
+            for cache_key, payload in entries.items():
+                pipe.setex(cache_key, self.CACHE_TTL_SECONDS, payload)
+            await pipe.execute()
+        except Exception as e:
+            logger.warning(
+                "backtest_cache_write_failed", keys=len(entries), error=str(e)
+            )
+
+    def _disk_cache_path(self, cache_key: str) -> Path:
+        """Map a Redis cache key onto its file in the disk cache."""
+        return self.disk_cache_dir / (cache_key.replace("/", "_") + ".bin")
+
+    def _disk_cache_read(self, cache_keys: list[str]) -> dict[str, bytes]:
+        """Read the fresh (younger than the TTL) disk cache entries for the keys."""
+        entries: dict[str, bytes] = {}
+        if self.disk_cache_dir is None:
+            return entries
+
+        oldest_fresh = datetime.now().timestamp() - self.CACHE_TTL_SECONDS
+        for cache_key in cache_keys:
+            path = self._disk_cache_path(cache_key)
+            try:
+                if path.stat().st_mtime >= oldest_fresh:
+                    entries[cache_key] = path.read_bytes()
+            except FileNotFoundError:
+                continue
+            except OSError as e:
+                logger.warning("backtest_disk_cache_read_failed", error=str(e))
+        return entries
+
+    def _disk_cache_write(self, entries: dict[str, bytes]) -> None:
+        """
+        Write disk cache entries atomically via temporary files.
+
+        Each write gets its own uniquely named temporary file, so concurrent
+        backtests or worker processes caching the same key never interleave
+        writes before the os.replace.
+        """
+        if self.disk_cache_dir is None or not entries:
+            return
+
+        try:
+            self.disk_cache_dir.mkdir(parents=True, exist_ok=True)
+            for cache_key, payload in entries.items():
+                path = self._disk_cache_path(cache_key)
+                with tempfile.NamedTemporaryFile(
+                    dir=path.parent, prefix=path.name, suffix=".tmp", delete=False
+                ) as tmp_file:
+                    tmp_file.write(payload)
+                try:
+                    os.replace(tmp_file.name, path)
+                except OSError:
+                    os.unlink(tmp_file.name)
+                    raise
+        except OSError as e:
+            logger.warning("backtest_disk_cache_write_failed", error=str(e))
+
+    async def _read_cached_series(
+        self, cache_keys: dict[str, str]
+    ) -> dict[str, pd.Series]:
+        """
+        Look up cached series by ticker: Redis first, then the disk cache.
+
+        Disk hits are copied back into Redis so the next request is served
+        from memory again.
+        """
+        payloads: dict[str, bytes] = {}
+        redis_entries = await self._cache_get_many(list(cache_keys.values()))
+        for cache_key, payload in zip(cache_keys.values(), redis_entries):
+            if payload:
+                payloads[cache_key] = payload
+
+        redis_misses = [key for key in cache_keys.values() if key not in payloads]
+        if redis_misses:
+            disk_entries = await asyncio.to_thread(self._disk_cache_read, redis_misses)
+            payloads.update(disk_entries)
+            await self._cache_set_many(disk_entries)
+
+        results: dict[str, pd.Series] = {}
+        for ticker, cache_key in cache_keys.items():
+            if cache_key not in payloads:
+                continue
+            try:
+                results[ticker] = self._decode_series(payloads[cache_key])
+            except Exception as e:
+                logger.warning(
+                    "backtest_cache_read_failed", cache_key=cache_key, error=str(e)
+                )
+        return results
+
+    async def _write_cached_series(self, entries: dict[str, bytes]) -> None:
+        """Store encoded series in Redis and in the disk cache."""
+        await self._cache_set_many(entries)
+        await asyncio.to_thread(self._disk_cache_write, entries)
 
     async def _download_historical_data_cached(
         self, tickers: list[str], period: str
     ) -> pd.DataFrame:
         """Download historical data with Redis caching and concurrent execution."""
+        tickers = list(dict.fromkeys(tickers))
+        cache_keys = {
+            ticker: self._generate_cache_key(ticker, period, "prices")
+            for ticker in tickers
+        }
 
-        async def fetch_ticker_data(ticker: str) -> tuple[str, pd.Series]:
-            """Fetch data for a single ticker with caching."""
-            cache_key = self._generate_cache_key(ticker, period, "prices")
-
-            # Try cache first
-            if self.redis_client:
-                try:
-                    cached_data = self.redis_client.get(cache_key)
-                    if cached_data:
-                        data_dict = json.loads(cached_data)
-                        return ticker, pd.Series(
-                            data_dict["prices"],
-                            index=pd.to_datetime(data_dict["dates"]),
-                        )
-                except Exception as e:
-                    logger.warning(f"Cache read error for {ticker}: {e}")
+        # Read every ticker's cache entry (one Redis round trip, then disk)
+        results = await self._read_cached_series(cache_keys)
 
-            # Cache miss - fetch from yfinance
+        # Download all cache misses with a single multi-ticker request
+        missing_tickers = [ticker for ticker in tickers if ticker not in results]
+        if missing_tickers:
             try:
-                data = yf.download(
-                    ticker, period=period, interval="1d", auto_adjust=True, prepost=True
+                data = await asyncio.to_thread(
+                    yf.download,
+                    missing_tickers,
+                    period=period,
+                    interval="1d",
+                    auto_adjust=True,
+                    prepost=True,
+                    group_by="ticker",
+                    threads=True,
                 )
-                if data.empty:
-                    raise ValueError(f"No data available for {ticker}")
-
-                close_prices = data["Close"]
-
-                # Ensure close_prices is a Series (in case yfinance returns DataFrame)
-                if isinstance(close_prices, pd.DataFrame):
-                    close_prices = (
-                        close_prices.squeeze()
-                    )  # Convert single-column DataFrame to Series
-
-                # Cache the result with robust serialization
-                if self.redis_client and not close_prices.empty:
-                    try:
-                        cache_data = {
-                            "prices": close_prices.values.tolist(),  # Use .values.tolist() for safe serialization
-                            "dates": close_prices.index.strftime("%Y-%m-%d").tolist(),
-                        }
-                        self.redis_client.setex(
-                            cache_key, 86400, json.dumps(cache_data)
-                        )  # 24h TTL
-                    except Exception as e:
-                        logger.warning(f"Cache write error for {ticker}: {e}")
-
-                return ticker, close_prices
-
             except Exception as e:
-                logger.error(f"Failed to download data for {ticker}: {e}")
-                raise ValueError(f"Failed to retrieve data for {ticker}: {str(e)}")
+                logger.error(
+                    "price_download_failed", tickers=missing_tickers, error=str(e)
+                )
+                raise ValueError(
+                    f"Failed to retrieve data for {', '.join(missing_tickers)}: {str(e)}"
+                )
+
+            fresh_entries: dict[str, bytes] = {}
+            for ticker in missing_tickers:
+                close_prices = self._extract_close_prices(data, ticker)
+                if close_prices.empty:
+                    logger.error("price_download_empty", ticker=ticker)
+                    raise ValueError(
+                        f"Failed to retrieve data for {ticker}: "
+                        f"No data available for {ticker}"
+                    )
+                results[ticker] = close_prices
+                fresh_entries[cache_keys[ticker]] = self._encode_series(close_prices)
 
-        # Execute all downloads concurrently
-        tasks = [fetch_ticker_data(ticker) for ticker in tickers]
-        results = await asyncio.gather(*tasks)
+            # Cache the downloads in the compact binary encoding
+            await self._write_cached_series(fresh_entries)
 
         # Combine results into DataFrame with proper DatetimeIndex
-        data_dict = dict(results)
-        combined_df = pd.DataFrame(data_dict)
+        combined_df = pd.DataFrame({ticker: results[ticker] for ticker in tickers})
 
         # Ensure DataFrame has a proper DatetimeIndex for backtesting
         if not isinstance(combined_df.index, pd.DatetimeIndex):
@@ -1773,7 +2326,7 @@ class PortfolioBacktestService:
             try:
                 combined_df.index = pd.to_datetime(combined_df.index)
             except Exception as e:
-                logger.error(f"Failed to convert index to DatetimeIndex: {e}")
+                logger.error("price_index_conversion_failed", error=str(e))
                 raise ValueError("Invalid date index in historical data")
 
         # Sort by date to ensure chronological order
@@ -1785,31 +2338,21 @@ class PortfolioBacktestService:
         self, tickers: list[str], period: str
     ) -> dict[str, pd.Series]:
         """Download dividend data concurrently with caching."""
+        tickers = list(dict.fromkeys(tickers))
+        cache_keys = {
+            ticker: self._generate_cache_key(ticker, period, "dividends")
+            for ticker in tickers
+        }
 
-        async def fetch_dividend_data(ticker: str) -> tuple[str, pd.Series]:
-            """Fetch dividend data for single ticker."""
-            cache_key = self._generate_cache_key(ticker, period, "dividends")
+        # Read every ticker's cache entry (one Redis round trip, then disk)
+        results = await self._read_cached_series(cache_keys)
 
-            # Try cache first
-            if self.redis_client:
-                try:
-                    cached_data = self.redis_client.get(cache_key)
-                    if cached_data:
-                        data_dict = json.loads(cached_data)
-                        if data_dict["dividends"]:
-                            return ticker, pd.Series(
-                                data_dict["dividends"],
-                                index=pd.to_datetime(data_dict["dates"]),
-                            )
-                        else:
-                            return ticker, pd.Series(dtype=float)
-                except Exception as e:
-                    logger.warning(f"Dividend cache read error for {ticker}: {e}")
-
-            # Fetch from yfinance
+        async def fetch_dividend_data(ticker: str) -> tuple[str, pd.Series | None]:
+            """Fetch dividend data for a single ticker from yfinance."""
             try:
-                ticker_obj = yf.Ticker(ticker)
-                dividends = ticker_obj.dividends
+                # yfinance is blocking; run each miss in a worker thread so
+                # the lookups actually overlap
+                dividends = await asyncio.to_thread(lambda: yf.Ticker(ticker).dividends)
 
                 # Filter by period
                 if not dividends.empty:
@@ -1830,41 +2373,43 @@ class PortfolioBacktestService:
                         )
                         dividends = dividends[dividends.index >= compatible_start_date]
 
-                # Cache result
-                if self.redis_client:
-                    try:
-                        if not dividends.empty:
-                            cache_data = {
-                                "dividends": dividends.tolist(),
-                                "dates": dividends.index.strftime("%Y-%m-%d").tolist(),
-                            }
-                        else:
-                            cache_data = {"dividends": [], "dates": []}
-                        self.redis_client.setex(
-                            cache_key, 86400, json.dumps(cache_data)
-                        )
-                    except Exception as e:
-                        logger.warning(f"Dividend cache write error for {ticker}: {e}")
-
                 return ticker, dividends
 
             except Exception as e:
-                logger.warning(f"Could not download dividends for {ticker}: {e}")
-                return ticker, pd.Series(dtype=float)
+                logger.warning("dividend_download_failed", ticker=ticker, error=str(e))
+                return ticker, None
+
+        # Download only the cache misses, concurrently
+        missing_tickers = [ticker for ticker in tickers if ticker not in results]
+        downloaded = await asyncio.gather(
+            *(fetch_dividend_data(ticker) for ticker in missing_tickers)
+        )
 
-        # Execute dividend downloads concurrently
-        tasks = [fetch_dividend_data(ticker) for ticker in tickers]
-        results = await asyncio.gather(*tasks)
+        # Failed downloads fall back to no dividends and are not cached
+        fresh_entries: dict[str, bytes] = {}
+        for ticker, dividends in downloaded:
+            if dividends is None:
+                results[ticker] = pd.Series(dtype=float)
+                continue
+            results[ticker] = dividends
+            fresh_entries[cache_keys[ticker]] = self._encode_series(dividends)
+        await self._write_cached_series(fresh_entries)
 
-        return dict(results)
+        return results
 
     def _calculate_portfolio_daily_returns(
         self,
         hist_data: pd.DataFrame,
         composition: list[PortfolioComposition],
         tickers: list[str],
+        asset_returns: pd.DataFrame | None = None,
     ) -> pd.Series:
-        """Calculate portfolio daily returns (not cumulative) for accurate metrics."""
+        """
+        Calculate portfolio daily returns (not cumulative) for accurate metrics.
+
+        asset_returns may carry daily returns already computed from hist_data,
+        so they are not recomputed here.
+        """
 
         # Robust validation of DataFrame structure for backtesting
         if hist_data.empty:
@@ -1879,7 +2424,7 @@ class PortfolioBacktestService:
         # Ensure chronological order
         if not hist_data.index.is_monotonic_increasing:
             hist_data = hist_data.sort_index()
-            logger.info("Historical data sorted chronologically for backtesting")
+            logger.info("backtest_prices_sorted")
 
         # Create weights dictionary
         weights = {comp.ticker: comp.weight for comp in composition}
@@ -1890,13 +2435,19 @@ class PortfolioBacktestService:
             raise ValueError(f"Missing price data for tickers: {missing_tickers}")
 
         # Calculate daily returns for each asset
-        asset_returns = hist_data[tickers].pct_change().fillna(0)
-
-        # Calculate weighted portfolio daily returns
-        portfolio_daily_returns = pd.Series(0.0, index=asset_returns.index)
-        for ticker in tickers:
-            if ticker in weights:
-                portfolio_daily_returns += asset_returns[ticker] * weights[ticker]
+        if asset_returns is None:
+            asset_returns = hist_data[tickers].pct_change().fillna(0)
+        else:
+            asset_returns = asset_returns.loc[hist_data.index, tickers]
+
+        # Calculate weighted portfolio daily returns with a single dot product
+        ticker_weights = np.array(
+            [weights.get(ticker, 0.0) for ticker in tickers], dtype=np.float64
+        )
+        portfolio_daily_returns = pd.Series(
+            asset_returns.to_numpy(dtype=np.float64) @ ticker_weights,
+            index=asset_returns.index,
+        )
 
         return portfolio_daily_returns.dropna()
 
@@ -1904,21 +2455,35 @@ class PortfolioBacktestService:
         self, daily_returns: pd.Series, start_value: float = 100.0
     ) -> pd.Series:
         """Convert daily returns to cumulative returns for visualization."""
-        return (1 + daily_returns).cumprod() * start_value
+        return pd.Series(
+            np.cumprod(1 + daily_returns.to_numpy(dtype=np.float64)) * start_value,
+            index=daily_returns.index,
+        )
 
     def _calculate_benchmark_returns(
-        self, hist_data: pd.DataFrame, benchmarks: list[str]
+        self,
+        hist_data: pd.DataFrame,
+        benchmarks: list[str],
+        asset_returns: pd.DataFrame | None = None,
     ) -> dict[str, pd.Series]:
         """Calculate benchmark cumulative returns."""
-        benchmark_returns = {}
+        available = [b for b in dict.fromkeys(benchmarks) if b in hist_data.columns]
+        if not available:
+            return {}
+
+        if asset_returns is None:
+            asset_returns = hist_data[available].pct_change().fillna(0)
 
-        for benchmark in benchmarks:
-            if benchmark in hist_data.columns:
-                daily_returns = hist_data[benchmark].pct_change().fillna(0)
-                cumulative_returns = self._calculate_cumulative_returns(daily_returns)
-                benchmark_returns[benchmark] = cumulative_returns
+        # One cumulative product over the benchmark columns, then slice
+        cumulative = (
+            np.cumprod(1 + asset_returns[available].to_numpy(dtype=np.float64), axis=0)
+            * 100.0
+        )
 
-        return benchmark_returns
+        return {
+            benchmark: pd.Series(cumulative[:, column], index=asset_returns.index)
+            for column, benchmark in enumerate(available)
+        }
 
     def _calculate_performance_metrics_corrected(
         self, daily_returns: pd.Series, benchmark_returns: dict[str, pd.Series]
@@ -1934,33 +2499,43 @@ class PortfolioBacktestService:
         if len(daily_returns) < 2:
             raise ValueError("Insufficient data points for performance calculation")
 
+        # Work on the raw array; pandas alignment adds nothing here
+        returns = daily_returns.to_numpy(dtype=np.float64)
+
+        # Growth path shared by total return and drawdown
+        cumulative_returns = np.cumprod(1 + returns)
+
         # Total Return
-        total_return = (1 + daily_returns).prod() - 1
+        total_return = cumulative_returns[-1] - 1
 
         # Annualized Return
-        trading_days = len(daily_returns)
-        years = trading_days / 252.0
+        trading_days = returns.shape[0]
+        years = trading_days / _TRADING_DAYS
         annualized_return = (1 + total_return) ** (1 / years) - 1 if years > 0 else 0
 
         # Annualized Volatility (Industry Standard)
-        daily_volatility = daily_returns.std()
-        annualized_volatility = daily_volatility * np.sqrt(252)
+        mean_return = returns.mean()
+        deviations = returns - mean_return
+        daily_volatility = np.sqrt(deviations @ deviations / (trading_days - 1))
+        annualized_volatility = daily_volatility * _SQRT_252
 
         # Sharpe Ratio (Corrected - using daily returns)
-        # Using 2% risk-free rate (clearly documented assumption)
-        risk_free_rate_annual = 0.02
-        risk_free_rate_daily = risk_free_rate_annual / 252
-        excess_returns = daily_returns - risk_free_rate_daily
+        # Using 2% risk-free rate (clearly documented assumption); the mean
+        # excess return is the mean return shifted by the daily rate
         sharpe_ratio = (
-            (excess_returns.mean() * 252) / annualized_volatility
+            ((mean_return - _RF_DAILY) * _TRADING_DAYS) / annualized_volatility
             if annualized_volatility > 0
             else 0
         )
 
         # Maximum Drawdown (Corrected Algorithm)
-        cumulative_returns = self._calculate_cumulative_returns(daily_returns, 1.0)
-        running_max = cumulative_returns.expanding().max()
-        drawdowns = (cumulative_returns - running_max) / running_max
+        drawdown_path = (
+            cumulative_returns.astype(np.float32)
+            if trading_days >= _FLOAT32_DRAWDOWN_MIN_DAYS
+            else cumulative_returns
+        )
+        running_max = np.maximum.accumulate(drawdown_path)
+        drawdowns = drawdown_path / running_max - 1
         max_drawdown = drawdowns.min()  # Most negative value
 
         # Start and end values for visualization
@@ -1976,25 +2551,33 @@ class PortfolioBacktestService:
             "start_value": float(start_value),
             "end_value": float(end_value),
             "trading_days": int(trading_days),
-            "risk_free_rate_assumption": 0.02,
+            "risk_free_rate_assumption": _RF_ANNUAL,
         }
 
-        # Add benchmark comparisons using same methodology
-        for benchmark_name, benchmark_series in benchmark_returns.items():
-            if not benchmark_series.empty and len(benchmark_series) > 1:
-                bench_daily_returns = benchmark_series.pct_change().dropna()
-                if len(bench_daily_returns) > 0:
-                    bench_total_return = (1 + bench_daily_returns).prod() - 1
-                    metrics[f"{benchmark_name}_total_return"] = float(
-                        bench_total_return
-                    )
-                    metrics[f"vs_{benchmark_name}"] = float(
-                        total_return - bench_total_return
-                    )
-                    metrics[f"alpha_vs_{benchmark_name}"] = float(
-                        annualized_return
-                        - ((1 + bench_total_return) ** (1 / years) - 1)
-                    )
+        # Add benchmark comparisons using same methodology, computed for all
+        # benchmarks at once on a date-aligned (days x benchmarks) matrix
+        bench_names = [
+            name for name, series in benchmark_returns.items() if len(series) > 1
+        ]
+        if bench_names:
+            bench_values = pd.concat(
+                [benchmark_returns[name] for name in bench_names], axis=1
+            ).to_numpy(dtype=np.float64)
+            bench_daily_returns = bench_values[1:] / bench_values[:-1] - 1
+            has_returns = (~np.isnan(bench_daily_returns)).any(axis=0)
+            bench_total_returns = np.nanprod(1 + bench_daily_returns, axis=0) - 1
+            bench_annualized_returns = (1 + bench_total_returns) ** (1 / years) - 1
+
+            for name, bench_total_return, bench_annualized_return, valid in zip(
+                bench_names, bench_total_returns, bench_annualized_returns, has_returns
+            ):
+                if not valid:
+                    continue
+                metrics[f"{name}_total_return"] = float(bench_total_return)
+                metrics[f"vs_{name}"] = float(total_return - bench_total_return)
+                metrics[f"alpha_vs_{name}"] = float(
+                    annualized_return - bench_annualized_return
+                )
 
         return metrics
 
@@ -2006,43 +2589,72 @@ class PortfolioBacktestService:
         dividend_data: dict[str, pd.Series],
     ) -> list[BacktestDataPoint]:
         """Generate data points for visualization."""
-        data_points = []
+        # Align every series to the backtest dates once, up front; days are
+        # handled as datetime64[D] numbers rather than Python date objects
+        local_dates = dates.tz_localize(None) if dates.tz is not None else dates
+        days = local_dates.values.astype("datetime64[D]")
+        day_labels = np.datetime_as_string(days).tolist()
+        day_numbers = days.view(np.int64).tolist()
+        portfolio_values = portfolio_cumulative.reindex(dates).to_numpy(
+            dtype=np.float64
+        )
+        benchmark_arrays = {
+            benchmark: returns.reindex(dates).to_numpy(dtype=np.float64)
+            for benchmark, returns in benchmark_returns.items()
+        }
+        dividend_events_by_day = self._group_dividend_events(dividend_data)
 
-        for date in dates:
-            # Portfolio value
-            portfolio_value = float(portfolio_cumulative.loc[date])
-
-            # Benchmark values
-            benchmark_values = {}
-            for benchmark, returns in benchmark_returns.items():
-                if date in returns.index:
-                    benchmark_values[benchmark] = float(returns.loc[date])
-
-            # Dividend events for this date
-            dividend_events = []
-            for ticker, dividends in dividend_data.items():
-                if not dividends.empty and date.date() in [
-                    d.date() for d in dividends.index
-                ]:
-                    # Use timezone-aware date comparison by converting both to date objects
-                    matching_dividends = dividends[dividends.index.date == date.date()]
-                    if not matching_dividends.empty:
-                        dividend_amount = matching_dividends.iloc[0]
-                        dividend_events.append(
-                            {"ticker": ticker, "amount": float(dividend_amount)}
-                        )
+        data_points = []
+        for i, (day, day_number) in enumerate(zip(day_labels, day_numbers)):
+            # Benchmark values (dates a benchmark lacks are left out)
+            benchmark_values = {
+                benchmark: float(values[i])
+                for benchmark, values in benchmark_arrays.items()
+                if not np.isnan(values[i])
+            }
 
+            # Values are built locally from floats and strings, so skip
+            # per-point validation
             data_points.append(
-                BacktestDataPoint(
-                    date=date.strftime("%Y-%m-%d"),
-                    portfolio_value=portfolio_value,
+                BacktestDataPoint.model_construct(
+                    date=day,
+                    portfolio_value=float(portfolio_values[i]),
                     benchmark_values=benchmark_values,
-                    dividend_events=dividend_events,
+                    dividend_events=dividend_events_by_day.get(day_number, []),
                 )
             )
 
         return data_points
 
+    @staticmethod
+    def _group_dividend_events(
+        dividend_data: dict[str, pd.Series],
+    ) -> dict[int, list[dict[str, float | str]]]:
+        """
+        Group dividend events by calendar day (datetime64[D] day number).
+
+        Days are taken in each series' own timezone, and only the first
+        payment per ticker per day is kept.
+        """
+        events_by_day: dict[int, list[dict[str, float | str]]] = {}
+        for ticker, dividends in dividend_data.items():
+            if dividends.empty:
+                continue
+
+            index = pd.DatetimeIndex(dividends.index)
+            if index.tz is not None:
+                index = index.tz_localize(None)
+            days = index.values.astype("datetime64[D]").view(np.int64)
+            unique_days, first_per_day = np.unique(days, return_index=True)
+            amounts = dividends.to_numpy(dtype=np.float64)[first_per_day]
+
+            for day, amount in zip(unique_days.tolist(), amounts.tolist()):
+                events_by_day.setdefault(day, []).append(
+                    {"ticker": ticker, "amount": float(amount)}
+                )
+
+        return events_by_day
+
 
 # Global Redis client and availability flag for dashboard caching
 try:
@@ -2052,3 +2664,15 @@ try:
 except Exception:
     redis_client = None
     REDIS_AVAILABLE = False
+
+
+def create_backtest_redis_client() -> aioredis.Redis:
+    """
+    Build the asyncio Redis client for the backtest cache.
+
+    Connections are pooled and opened lazily, so they bind to the event loop
+    that first uses them: create the client inside the running app (lifespan)
+    and close it on shutdown. Responses stay raw bytes for the binary series
+    encoding.
+    """
+    return aioredis.from_url(settings.REDIS_URL, max_connections=32)
@@ -6,8 +6,10 @@ from typing import Any
 import httpx
 import redis.asyncio as redis
 import structlog
+from arq import func
 from arq.connections import RedisSettings
-from sqlmodel import SQLModel
+from sqlalchemy.orm import sessionmaker
+from sqlmodel import Session, SQLModel, select
 
 # Clear metadata before any imports to prevent conflicts
 SQLModel.metadata.clear()
@@ -17,20 +19,38 @@ logger = structlog.get_logger(__name__)
 # Configuration
 REDIS_URL = os.getenv("REDIS_URL", "redis://redis:6379")
 SYNC_BRIDGE_URL = os.getenv("SYNC_BRIDGE_URL", "http://sync_bridge:8001")
-
-# HTTP client for sync bridge
-sync_client = httpx.AsyncClient(timeout=30.0)
+NOTIFICATION_STREAM = os.getenv("NOTIFICATION_STREAM", "notifications")
+NOTIFICATION_BATCH_SIZE = 100
+NOTIFICATION_BATCH_BLOCK_MS = 100
+NOTIFICATION_DEAD_LETTER_STREAM = f"{NOTIFICATION_STREAM}:dead"
+NOTIFICATION_STREAM_MAXLEN = 10000
+NOTIFICATION_MAX_DELIVERIES = 10
+NOTIFICATION_CLAIM_IDLE_MS = 60_000
+OUTBOX_JSON_FIELDS = frozenset({"payload", "metadata"})
+SNAPSHOT_BATCH_SIZE = 100
+SNAPSHOT_CONCURRENCY = 8
+
+# HTTP client for sync bridge; keep-alive connections are pooled and reused
+# across event bursts instead of reconnecting per request
+sync_client = httpx.AsyncClient(
+    timeout=30.0,
+    limits=httpx.Limits(
+        max_connections=64, max_keepalive_connections=32, keepalive_expiry=60
+    ),
+)
 
 
 class EventWorker:
     """ARQ worker for processing client events from outbox stream"""
 
-    def __init__(self) -> None:
+    def __init__(self, session_factory: sessionmaker | None = None) -> None:
         self.redis_client = None
+        self.session_factory = session_factory
 
     async def startup(self) -> None:
         """Initialize worker"""
-        self.redis_client = redis.from_url(REDIS_URL)
+        # Decode stream fields in the client (hiredis does it in C when installed)
+        self.redis_client = redis.from_url(REDIS_URL, decode_responses=True)
         logger.info("EventWorker started")
 
     async def shutdown(self) -> None:
@@ -72,6 +92,44 @@ class EventWorker:
             logger.error("Failed to process event", error=str(e))
             return False
 
+    @staticmethod
+    def _decode_event(fields: dict[str, str]) -> dict[str, Any]:
+        """Convert an outbox stream entry into event data"""
+        # Convert Redis hash to dict
+        event_data: dict[str, Any] = dict(fields)
+
+        # Parse JSON fields
+        for field in OUTBOX_JSON_FIELDS & event_data.keys():
+            event_data[field] = json.loads(event_data[field])
+
+        return event_data
+
+    async def _dispatch_events(
+        self, events: list[tuple[Any, dict[str, Any]]]
+    ) -> list[Any]:
+        """Process events in order, returning the ids of those that succeeded"""
+        processed_ids = []
+        for message_id, event_data in events:
+            try:
+                success = await self.process_client_event(event_data)
+
+                if success:
+                    processed_ids.append(message_id)
+                else:
+                    logger.warning(
+                        "Event processing failed, will retry",
+                        message_id=message_id,
+                    )
+
+            except Exception as e:
+                logger.error(
+                    "Failed to process message",
+                    message_id=message_id,
+                    error=str(e),
+                )
+
+        return processed_ids
+
     async def consume_outbox_stream(self) -> None:
         """Continuously consume events from Redis stream"""
         consumer_group = "event_workers"
@@ -102,47 +160,49 @@ class EventWorker:
                         block=1000,  # 1 second timeout
                     )
 
+                    # Events for the same client stay in stream order; events
+                    # for different clients are dispatched concurrently
+                    events_by_client: dict[Any, list[tuple[Any, dict[str, Any]]]] = {}
                     for stream_name, stream_messages in messages:
                         for message_id, fields in stream_messages:
                             try:
-                                # Convert Redis hash to dict
-                                event_data = {
-                                    k.decode(): v.decode() for k, v in fields.items()
-                                }
-
-                                # Parse JSON fields
-                                if "payload" in event_data:
-                                    event_data["payload"] = json.loads(
-                                        event_data["payload"]
-                                    )
-                                if "metadata" in event_data:
-                                    event_data["metadata"] = json.loads(
-                                        event_data["metadata"]
-                                    )
-
-                                # Process the event
-                                success = await self.process_client_event(event_data)
-
-                                if success:
-                                    # Acknowledge message
-                                    await self.redis_client.xack(
-                                        "outbox", consumer_group, message_id
-                                    )
-                                    logger.debug(
-                                        "Message acknowledged", message_id=message_id
-                                    )
-                                else:
-                                    logger.warning(
-                                        "Event processing failed, will retry",
-                                        message_id=message_id,
-                                    )
-
+                                event_data = self._decode_event(fields)
                             except Exception as e:
                                 logger.error(
                                     "Failed to process message",
                                     message_id=message_id,
                                     error=str(e),
                                 )
+                                continue
+
+                            payload = event_data.get("payload")
+                            client_id = (
+                                payload.get("id") if isinstance(payload, dict) else None
+                            )
+                            events_by_client.setdefault(client_id, []).append(
+                                (message_id, event_data)
+                            )
+
+                    results = await asyncio.gather(
+                        *(
+                            self._dispatch_events(events)
+                            for events in events_by_client.values()
+                        ),
+                        return_exceptions=True,
+                    )
+
+                    # Acknowledge every processed message with a single XACK
+                    acked_ids = [
+                        message_id
+                        for result in results
+                        if not isinstance(result, BaseException)
+                        for message_id in result
+                    ]
+                    if acked_ids:
+                        await self.redis_client.xack(
+                            "outbox", consumer_group, *acked_ids
+                        )
+                        logger.debug("Messages acknowledged", count=len(acked_ids))
 
                 except Exception as e:
                     logger.error("Stream reading error", error=str(e))
@@ -152,17 +212,262 @@ class EventWorker:
             logger.error("Fatal stream consumer error", error=str(e))
             raise
 
+    def _persist_notifications(self, notifications: list[Any]) -> list[dict[str, Any]]:
+        """Insert a batch of notifications and return their realtime payloads (runs in a thread)"""
+        from cactus_wealth.repositories import NotificationRepository  # Defer import
+        from cactus_wealth.services import NotificationService
+
+        with self.session_factory() as session:
+            NotificationRepository(session).create_many(notifications)
+            return [
+                NotificationService.realtime_payload(notification)
+                for notification in notifications
+            ]
+
+    async def _claim_stale_notifications(
+        self, consumer_group: str, consumer_name: str
+    ) -> None:
+        """Take over entries left pending by consumers that stopped (e.g. a restart)"""
+        start_id = "0-0"
+        while True:
+            # Claimed entries become this consumer's pending entries; the "0"
+            # read that follows delivers them
+            start_id, *_ = await self.redis_client.xautoclaim(
+                NOTIFICATION_STREAM,
+                consumer_group,
+                consumer_name,
+                min_idle_time=NOTIFICATION_CLAIM_IDLE_MS,
+                start_id=start_id,
+                count=NOTIFICATION_BATCH_SIZE,
+            )
+            if start_id == "0-0":
+                return
+
+    async def _delivery_counts(
+        self, consumer_group: str, consumer_name: str, message_ids: list[str]
+    ) -> dict[str, int]:
+        """Look up how often each pending entry has been delivered"""
+        pending = await self.redis_client.xpending_range(
+            NOTIFICATION_STREAM,
+            consumer_group,
+            min=message_ids[0],
+            max=message_ids[-1],
+            count=len(message_ids),
+            consumername=consumer_name,
+        )
+        return {entry["message_id"]: entry["times_delivered"] for entry in pending}
+
+    async def _dead_letter_notifications(
+        self, consumer_group: str, rejected: list[tuple[str, Any, str]]
+    ) -> None:
+        """Move entries that can't be persisted to the dead-letter stream, then ack"""
+        for message_id, fields, reason in rejected:
+            await self.redis_client.xadd(
+                NOTIFICATION_DEAD_LETTER_STREAM,
+                {**(fields or {}), "source_id": message_id, "reason": reason},
+                maxlen=NOTIFICATION_STREAM_MAXLEN,
+                approximate=True,
+            )
+            logger.error(
+                "Notification dead-lettered", message_id=message_id, reason=reason
+            )
+        await self.redis_client.xack(
+            NOTIFICATION_STREAM,
+            consumer_group,
+            *(message_id for message_id, _fields, _reason in rejected),
+        )
+
+    async def _persist_notification_entries(
+        self, consumer_group: str, entries: list[tuple[str, Any]]
+    ) -> None:
+        """Persist parsed entries, then ack them and push them in real-time"""
+        from cactus_wealth.services import NotificationService  # Defer import
+
+        try:
+            # The insert and commit are blocking; keep them off the event loop
+            payloads = await asyncio.to_thread(
+                self._persist_notifications, [n for _id, n in entries]
+            )
+            acked_ids = [message_id for message_id, _n in entries]
+        except Exception as e:
+            if len(entries) == 1:
+                raise
+            # One bad row (e.g. an unknown user_id) fails the whole insert;
+            # retry one by one so the rest of the batch still goes through.
+            # Failed entries stay pending until they reach the delivery limit
+            logger.warning("Notification batch insert failed", error=str(e))
+            payloads, acked_ids = [], []
+            for message_id, notification in entries:
+                try:
+                    # Fresh instances: the failed batch may have left state on them
+                    payloads += await asyncio.to_thread(
+                        self._persist_notifications,
+                        [
+                            type(notification)(
+                                user_id=notification.user_id,
+                                message=notification.message,
+                            )
+                        ],
+                    )
+                    acked_ids.append(message_id)
+                except Exception as entry_error:
+                    logger.error(
+                        "Notification insert failed",
+                        message_id=message_id,
+                        error=str(entry_error),
+                    )
+
+        if acked_ids:
+            await self.redis_client.xack(
+                NOTIFICATION_STREAM, consumer_group, *acked_ids
+            )
+            logger.info("Notifications persisted", count=len(acked_ids))
+            await NotificationService.send_realtime_notifications(payloads)
+
+        if len(acked_ids) < len(entries):
+            raise RuntimeError(
+                f"{len(entries) - len(acked_ids)} notifications left pending"
+            )
+
+    async def consume_notification_stream(self) -> None:
+        """Continuously drain queued notifications and insert them in batches"""
+        from cactus_wealth.models import Notification  # Defer import
+
+        consumer_group = "notification_workers"
+        consumer_name = f"worker-{os.getpid()}"
+
+        try:
+            await self.redis_client.xgroup_create(
+                NOTIFICATION_STREAM, consumer_group, id="0", mkstream=True
+            )
+        except Exception as e:
+            logger.warning(f"Group creation failed: {e}")
+            # Group probably already exists
+
+        logger.info(
+            "Starting notification consumer",
+            group=consumer_group,
+            consumer=consumer_name,
+        )
+
+        # Entries read but never acked (a crash, a failed insert) stay pending;
+        # drain them with id "0" at startup and after every error before
+        # reading new entries with ">"
+        recovering = True
+        while True:
+            try:
+                if recovering:
+                    await self._claim_stale_notifications(
+                        consumer_group, consumer_name
+                    )
+
+                # Wait up to 100 ms for up to 100 messages, then flush
+                messages = await self.redis_client.xreadgroup(
+                    consumer_group,
+                    consumer_name,
+                    {NOTIFICATION_STREAM: "0" if recovering else ">"},
+                    count=NOTIFICATION_BATCH_SIZE,
+                    block=None if recovering else NOTIFICATION_BATCH_BLOCK_MS,
+                )
+                stream_entries = [
+                    (message_id, fields)
+                    for _stream_name, stream_messages in messages
+                    for message_id, fields in stream_messages
+                ]
+
+                if not stream_entries:
+                    recovering = False
+                    continue
+
+                delivery_counts = (
+                    await self._delivery_counts(
+                        consumer_group,
+                        consumer_name,
+                        [message_id for message_id, _fields in stream_entries],
+                    )
+                    if recovering
+                    else {}
+                )
+
+                # Parse entries one at a time so a malformed one can't block
+                # the batch
+                entries = []
+                rejected = []
+                for message_id, fields in stream_entries:
+                    if delivery_counts.get(message_id, 0) > NOTIFICATION_MAX_DELIVERIES:
+                        rejected.append((message_id, fields, "max_deliveries"))
+                        continue
+                    try:
+                        notification = Notification(
+                            user_id=int(fields["user_id"]),
+                            message=fields["message"],
+                        )
+                    except Exception as e:
+                        # Also covers entries trimmed from the stream while
+                        # pending, which come back without fields
+                        rejected.append((message_id, fields, f"malformed: {e}"))
+                        continue
+                    entries.append((message_id, notification))
+
+                if rejected:
+                    await self._dead_letter_notifications(consumer_group, rejected)
+                if entries:
+                    await self._persist_notification_entries(consumer_group, entries)
+
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error("Notification stream error", error=str(e))
+                recovering = True
+                await asyncio.sleep(5)  # Back off on errors
+
+
+def _snapshot_portfolio_batch(
+    session_factory: sessionmaker, portfolio_ids: list[int], prices: dict[str, float]
+) -> int:
+    """Snapshot a batch of portfolios in its own session (runs in a thread)"""
+    from cactus_wealth.core.dataprovider import YahooFinanceProvider  # Defer import
+    from cactus_wealth.services import PortfolioService
+
+    # Sessions are not thread-safe, so every batch gets its own
+    with session_factory() as session:
+        portfolio_service = PortfolioService(session, YahooFinanceProvider())
+        return portfolio_service.create_snapshots_for_portfolios(
+            portfolio_ids, prices=prices
+        )
+
 
 # ARQ worker function
 async def startup(ctx) -> None:
     """ARQ startup function"""
-    worker = EventWorker()
+    from cactus_wealth.database import engine  # Defer import
+
+    # One session factory per worker process, shared by every job
+    ctx["session_factory"] = sessionmaker(
+        bind=engine, class_=Session, expire_on_commit=False
+    )
+
+    worker = EventWorker(ctx["session_factory"])
     await worker.startup()
     ctx["worker"] = worker
 
+    # The notification consumer runs for the worker's whole lifetime, so it is
+    # a background task rather than an ARQ job (which job_timeout would kill)
+    ctx["notification_consumer"] = asyncio.create_task(
+        worker.consume_notification_stream()
+    )
+
 
 async def shutdown(ctx) -> None:
     """ARQ shutdown function"""
+    consumer = ctx.get("notification_consumer")
+    if consumer:
+        consumer.cancel()
+        try:
+            await consumer
+        except asyncio.CancelledError:
+            pass
+
     worker = ctx.get("worker")
     if worker:
         await worker.shutdown()
@@ -174,9 +479,78 @@ async def process_events(ctx) -> None:
     await worker.consume_outbox_stream()
 
 
+async def create_all_snapshots(ctx) -> int:
+    """ARQ job function - snapshot every portfolio in concurrent batches"""
+    from cactus_wealth.core.dataprovider import YahooFinanceProvider  # Defer import
+    from cactus_wealth.models import Asset, Portfolio, Position
+
+    session_factory = ctx["session_factory"]
+    with session_factory() as session:
+        tickers = list(
+            session.exec(
+                select(Asset.ticker_symbol)
+                .join(Position, Position.asset_id == Asset.id)
+                .distinct()
+            ).all()
+        )
+
+    # Price every held ticker once up front so batches share one market-data
+    # request instead of each fetching overlapping tickers
+    prices = await asyncio.to_thread(YahooFinanceProvider().get_current_prices, tickers)
+
+    # Database and market-data calls are blocking, so a pool of
+    # SNAPSHOT_CONCURRENCY consumers runs the batches in threads
+    batches: asyncio.Queue[list[int] | None] = asyncio.Queue(
+        maxsize=SNAPSHOT_CONCURRENCY * 2
+    )
+
+    async def consume_batches() -> int:
+        created = 0
+        while (batch := await batches.get()) is not None:
+            try:
+                created += await asyncio.to_thread(
+                    _snapshot_portfolio_batch, session_factory, batch, prices
+                )
+            except Exception as e:
+                logger.error("Snapshot batch failed", error=str(e))
+        return created
+
+    consumers = [
+        asyncio.create_task(consume_batches()) for _ in range(SNAPSHOT_CONCURRENCY)
+    ]
+
+    # Stream portfolio ids in batches so snapshotting starts with the first
+    # batch instead of after every id has been loaded
+    portfolio_count = 0
+    try:
+        with session_factory() as session:
+            partitions = session.exec(
+                select(Portfolio.id)
+                .order_by(Portfolio.id)
+                .execution_options(yield_per=SNAPSHOT_BATCH_SIZE)
+            ).partitions()
+            while (
+                batch := await asyncio.to_thread(next, partitions, None)
+            ) is not None:
+                portfolio_count += len(batch)
+                await batches.put(list(batch))
+    finally:
+        for _ in consumers:
+            await batches.put(None)
+
+    created = sum(await asyncio.gather(*consumers))
+
+    logger.info(
+        "Portfolio snapshots created", count=created, portfolios=portfolio_count
+    )
+    return created
+
+
 # ARQ worker settings
 class WorkerSettings:
-    functions = [process_events]
+    # Snapshot runs keep no result: core.arq enqueues them under a fixed job id,
+    # and a retained result would make ARQ refuse the next trigger for an hour
+    functions = [process_events, func(create_all_snapshots, keep_result=0)]
     on_startup = startup
     on_shutdown = shutdown
     redis_settings = RedisSettings.from_dsn(REDIS_URL)
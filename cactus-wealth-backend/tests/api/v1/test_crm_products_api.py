@@ -1,155 +1,305 @@
 import os
 import sys
+from collections.abc import Callable
+from datetime import datetime
 from decimal import Decimal
 
 import pytest
 from fastapi import FastAPI, Depends
 from fastapi.testclient import TestClient
 from sqlmodel import Session, SQLModel, create_engine
-from sqlalchemy import MetaData
-import sqlalchemy
+from sqlalchemy import MetaData, insert
 
 from cactus_wealth.api.v1.api import api_router
 from cactus_wealth.database import get_session as global_get_session
-from cactus_wealth.security import create_access_token
 from cactus_wealth.models import InvestmentAccount, InsurancePolicy, Client, User, Portfolio, Position, Asset, ClientNote, ClientActivity, Notification, ModelPortfolio, ModelPortfolioPosition
+from cactus_wealth.models import RiskProfile, UserRole
+from cactus_wealth.schemas import ClientCreate, UserCreate
+from cactus_wealth.crud import create_client, create_user
+
+from tests.factories import InsurancePolicyFactory, InvestmentAccountFactory
 
 # Eliminar imports y fixtures locales de engine/session/app/client
 # Usar solo la fixture global 'session' y 'test_client' de conftest.py
+# Los usuarios/clientes de ejemplo se crean una vez por módulo ('module_session')
 
 
-@pytest.fixture(autouse=True)
-def cleanup_users(session):
-    session.execute(sqlalchemy.text('TRUNCATE TABLE users RESTART IDENTITY CASCADE'))
-    session.commit()
-
-
-@pytest.fixture
-def sample_advisor(session: Session) -> "User":
-    from cactus_wealth.models import UserRole
-    from cactus_wealth.schemas import UserCreate
-
+@pytest.fixture(scope="module")
+def sample_advisor(module_session: Session) -> "User":
     user_data = UserCreate(
         username="test_advisor",
         email="advisor@test.com",
         password="testpass123",
         role=UserRole.JUNIOR_ADVISOR,
     )
-    from cactus_wealth.crud import create_user
-
-    return create_user(session=session, user_create=user_data)
 
+    return create_user(session=module_session, user_create=user_data)
 
-@pytest.fixture
-def sample_admin(session: Session) -> "User":
-    from cactus_wealth.models import UserRole
-    from cactus_wealth.schemas import UserCreate
 
+@pytest.fixture(scope="module")
+def sample_admin(module_session: Session) -> "User":
     user_data = UserCreate(
         username="test_admin",
         email="admin@test.com",
         password="testpass123",
         role=UserRole.ADMIN,
     )
-    from cactus_wealth.crud import create_user
-
-    return create_user(session=session, user_create=user_data)
 
+    return create_user(session=module_session, user_create=user_data)
 
-@pytest.fixture
-def sample_advisor_2(session: Session) -> "User":
-    from cactus_wealth.models import UserRole
-    from cactus_wealth.schemas import UserCreate
 
+@pytest.fixture(scope="module")
+def sample_advisor_2(module_session: Session) -> "User":
     user_data = UserCreate(
         username="advisor_2",
         email="advisor2@test.com",
         password="testpass123",
         role=UserRole.SENIOR_ADVISOR,
     )
-    from cactus_wealth.crud import create_user
 
-    return create_user(session=session, user_create=user_data)
+    return create_user(session=module_session, user_create=user_data)
 
 
-@pytest.fixture
-def sample_client(session: Session, sample_advisor: "User") -> "Client":
-    from cactus_wealth.models import RiskProfile
-    from cactus_wealth.schemas import ClientCreate
-
+@pytest.fixture(scope="module")
+def sample_client(module_session: Session, sample_advisor: "User") -> "Client":
     client_data = ClientCreate(
         first_name="Juan",
         last_name="Pérez",
         email="juan@test.com",
         risk_profile=RiskProfile.MEDIUM,
     )
-    from cactus_wealth.crud import create_client
 
     return create_client(
-        session=session, client=client_data, owner_id=sample_advisor.id
+        session=module_session, client=client_data, owner_id=sample_advisor.id
     )
 
 
-@pytest.fixture
-def sample_client_advisor_2(session: Session, sample_advisor_2: "User") -> "Client":
-    from cactus_wealth.models import RiskProfile
-    from cactus_wealth.schemas import ClientCreate
-
+@pytest.fixture(scope="module")
+def sample_client_advisor_2(module_session: Session, sample_advisor_2: "User") -> "Client":
     client_data = ClientCreate(
         first_name="María",
         last_name="González",
         email="maria@test.com",
         risk_profile=RiskProfile.HIGH,
     )
-    from cactus_wealth.crud import create_client
 
     return create_client(
-        session=session, client=client_data, owner_id=sample_advisor_2.id
+        session=module_session, client=client_data, owner_id=sample_advisor_2.id
+    )
+
+
+@pytest.fixture(scope="module")
+def get_auth_headers(token_for: Callable[[str], str]) -> Callable[["User"], dict]:
+    """Get authorization headers for a user from the session's token cache."""
+
+    def _auth_headers(user: "User") -> dict:
+        return {"Authorization": f"Bearer {token_for(user.email)}"}
+
+    return _auth_headers
+
+
+def bulk_insert(
+    session: Session, model: type[SQLModel], client_id: int, specs: list[dict]
+) -> list[int]:
+    """
+    Insert seed rows with one executemany and return their ids.
+
+    Core inserts skip the model's Python-side default factories, so the
+    timestamps are filled in here.
+    """
+    now = datetime.utcnow()
+    rows = [
+        {**spec, "client_id": client_id, "created_at": now, "updated_at": now}
+        for spec in specs
+    ]
+    return session.execute(insert(model).returning(model.id), rows).scalars().all()
+
+
+# ============ SHARED CRUD TESTS ============
+
+# Per-resource payloads for the CRUD happy paths shared by both product types
+CRUD_CASES = {
+    "investment-accounts": {
+        "factory": InvestmentAccountFactory,
+        "create": {
+            "platform": "Balanz",
+            "account_number": "BAL123456",
+            "aum": "50000.00",
+        },
+        "seed": {
+            "platform": "Test Platform",
+            "account_number": "TEST123",
+            "aum": Decimal("30000.00"),
+        },
+        "update": {"platform": "Updated Platform", "aum": "35000.00"},
+        "unchanged": "account_number",
+    },
+    "insurance-policies": {
+        "factory": InsurancePolicyFactory,
+        "create": {
+            "policy_number": "POL123456",
+            "insurance_type": "Seguro de Vida",
+            "premium_amount": "500.00",
+            "coverage_amount": "100000.00",
+        },
+        "seed": {
+            "policy_number": "GET123",
+            "insurance_type": "Seguro de Retiro",
+            "premium_amount": Decimal("450.00"),
+            "coverage_amount": Decimal("80000.00"),
+        },
+        "update": {"insurance_type": "Updated Type", "premium_amount": "350.00"},
+        "unchanged": "policy_number",
+    },
+}
+
+DECIMAL_FIELDS = {"aum", "premium_amount", "coverage_amount"}
+
+# Shared AUM of the pagination rows, built once instead of per row
+PAGE_AUM = Decimal(10000)
+
+
+def assert_fields(data: dict, expected: dict) -> None:
+    """Compare response fields, decimals by value (the API serializes them)."""
+    for field, value in expected.items():
+        if field in DECIMAL_FIELDS:
+            assert float(data[field]) == float(value), field
+        else:
+            assert data[field] == value, field
+
+
+@pytest.fixture(scope="module")
+def products_client(module_session: Session, sample_advisor: "User") -> "Client":
+    """Client owning the shared CRUD rows, kept apart from the list-count tests."""
+    client_data = ClientCreate(
+        first_name="Ana",
+        last_name="Gómez",
+        email="ana@test.com",
+        risk_profile=RiskProfile.LOW,
     )
 
+    return create_client(
+        session=module_session, client=client_data, owner_id=sample_advisor.id
+    )
 
-def get_auth_headers(user: "User") -> dict:
-    """Get authorization headers for a user."""
-    token = create_access_token(data={"sub": user.email})
-    return {"Authorization": f"Bearer {token}"}
 
+@pytest.fixture(scope="module")
+def created_products(module_session: Session, products_client: "Client") -> dict:
+    """
+    One seed row per resource, shared by the read/update/delete tests.
 
-# ============ INVESTMENT ACCOUNT TESTS ============
+    CRUD creation isn't under test, so rows are inserted directly; each test's
+    savepoint rolls back whatever it updates or deletes.
+    """
+    products = {
+        resource: case["factory"].create(
+            module_session, client_id=products_client.id, **case["seed"]
+        )
+        for resource, case in CRUD_CASES.items()
+    }
+    module_session.commit()
+    return {resource: product.id for resource, product in products.items()}
 
 
-def test_create_investment_account_success(
+@pytest.mark.parametrize("resource", list(CRUD_CASES))
+def test_create_product_success(
     test_client: TestClient,
     sample_advisor: "User",
     sample_client: "Client",
+    resource: str,
+    get_auth_headers: Callable[["User"], dict],
 ):
-    """Test successful creation of investment account."""
+    """Test successful creation of an investment account / insurance policy."""
     headers = get_auth_headers(sample_advisor)
-
-    account_data = {
-        "platform": "Balanz",
-        "account_number": "BAL123456",
-        "aum": "50000.00",
-        "client_id": sample_client.id,
-    }
+    payload = {**CRUD_CASES[resource]["create"], "client_id": sample_client.id}
 
     response = test_client.post(
-        f"/api/v1/clients/{sample_client.id}/investment-accounts/",
-        json=account_data,
+        f"/api/v1/clients/{sample_client.id}/{resource}/",
+        json=payload,
         headers=headers,
     )
 
     assert response.status_code == 201
+    assert_fields(response.json(), payload)
+
+
+@pytest.mark.parametrize("resource", list(CRUD_CASES))
+def test_get_product_success(
+    test_client: TestClient,
+    created_products: dict,
+    sample_advisor: "User",
+    products_client: "Client",
+    resource: str,
+    get_auth_headers: Callable[["User"], dict],
+):
+    """Test successful retrieval of an investment account / insurance policy."""
+    product_id = created_products[resource]
+    headers = get_auth_headers(sample_advisor)
+
+    response = test_client.get(f"/api/v1/{resource}/{product_id}", headers=headers)
+
+    assert response.status_code == 200
+    data = response.json()
+    assert data["id"] == product_id
+    assert data["client_id"] == products_client.id
+    assert_fields(data, CRUD_CASES[resource]["seed"])
+
+
+@pytest.mark.parametrize("resource", list(CRUD_CASES))
+def test_update_product_success(
+    test_client: TestClient,
+    created_products: dict,
+    sample_advisor: "User",
+    resource: str,
+    get_auth_headers: Callable[["User"], dict],
+):
+    """Test successful update of an investment account / insurance policy."""
+    case = CRUD_CASES[resource]
+    product_id = created_products[resource]
+    headers = get_auth_headers(sample_advisor)
+
+    response = test_client.put(
+        f"/api/v1/{resource}/{product_id}", json=case["update"], headers=headers
+    )
+
+    assert response.status_code == 200
     data = response.json()
-    assert data["platform"] == "Balanz"
-    assert data["account_number"] == "BAL123456"
-    assert float(data["aum"]) == 50000.00
-    assert data["client_id"] == sample_client.id
+    assert_fields(data, case["update"])
+    unchanged = case["unchanged"]
+    assert data[unchanged] == case["seed"][unchanged]  # Unchanged
+
+
+@pytest.mark.parametrize("resource", list(CRUD_CASES))
+def test_delete_product_success(
+    test_client: TestClient,
+    session: Session,
+    created_products: dict,
+    sample_advisor: "User",
+    resource: str,
+    get_auth_headers: Callable[["User"], dict],
+):
+    """Test successful deletion of an investment account / insurance policy."""
+    product_id = created_products[resource]
+    headers = get_auth_headers(sample_advisor)
+
+    response = test_client.delete(f"/api/v1/{resource}/{product_id}", headers=headers)
+
+    assert response.status_code == 200
+    assert response.json()["id"] == product_id
+
+    # Verificar en la base que fue borrado
+    session.expire_all()
+    assert session.get(CRUD_CASES[resource]["factory"].model, product_id) is None
+
+
+# ============ INVESTMENT ACCOUNT TESTS ============
 
 
 def test_create_investment_account_forbidden_wrong_advisor(
     test_client: TestClient,
     sample_advisor_2: "User",
     sample_client: "Client",
+    get_auth_headers: Callable[["User"], dict],
 ):
     """Test that advisor cannot create account for client that doesn't belong to them."""
     headers = get_auth_headers(sample_advisor_2)
@@ -172,7 +322,10 @@ def test_create_investment_account_forbidden_wrong_advisor(
 
 
 def test_create_investment_account_admin_access(
-    test_client: TestClient, sample_admin: "User", sample_client: "Client"
+    test_client: TestClient,
+    sample_admin: "User",
+    sample_client: "Client",
+    get_auth_headers: Callable[["User"], dict],
 ):
     """Test that admin can create account for any client."""
     headers = get_auth_headers(sample_admin)
@@ -195,38 +348,10 @@ def test_create_investment_account_admin_access(
     assert data["platform"] == "Decrypto"
 
 
-def test_get_investment_account_success(
+def test_get_investment_account_not_found(
     test_client: TestClient,
-    session: Session,
     sample_advisor: "User",
-    sample_client: "Client",
-):
-    """Test successful retrieval of investment account."""
-    # First create an account
-    import cactus_wealth.crud as crud
-    from cactus_wealth.schemas import InvestmentAccountCreate
-
-    account_data = InvestmentAccountCreate(
-        platform="Test Platform", account_number="TEST123", aum=Decimal("30000.00"), client_id=sample_client.id
-    )
-    account = crud.create_client_investment_account(
-        session=session, account_data=account_data, client_id=sample_client.id
-    )
-
-    headers = get_auth_headers(sample_advisor)
-
-    response = test_client.get(f"/api/v1/investment-accounts/{account.id}", headers=headers)
-
-    assert response.status_code == 200
-    data = response.json()
-    assert data["platform"] == "Test Platform"
-    assert data["account_number"] == "TEST123"
-    assert float(data["aum"]) == 30000.00
-    assert data["client_id"] == sample_client.id
-
-
-def test_get_investment_account_not_found(
-    test_client: TestClient, sample_advisor: "User"
+    get_auth_headers: Callable[["User"], dict],
 ):
     """Test retrieval of non-existent investment account."""
     headers = get_auth_headers(sample_advisor)
@@ -242,22 +367,23 @@ def test_get_investment_accounts_for_client(
     session: Session,
     sample_advisor: "User",
     sample_client: "Client",
+    get_auth_headers: Callable[["User"], dict],
 ):
     """Test getting all investment accounts for a client."""
     # Create multiple accounts
-    import cactus_wealth.crud as crud
-    from cactus_wealth.schemas import InvestmentAccountCreate
-
-    for i in range(3):
-        account_data = InvestmentAccountCreate(
-            platform=f"Platform{i}",
-            account_number=f"ACC{i}",
-            aum=Decimal(f"{10000 + i * 5000}.00"),
-            client_id=sample_client.id
-        )
-        crud.create_client_investment_account(
-            session=session, account_data=account_data, client_id=sample_client.id
-        )
+    bulk_insert(
+        session,
+        InvestmentAccount,
+        sample_client.id,
+        [
+            {
+                "platform": f"Platform{i}",
+                "account_number": f"ACC{i}",
+                "aum": Decimal(10000 + i * 5000),
+            }
+            for i in range(3)
+        ],
+    )
 
     headers = get_auth_headers(sample_advisor)
 
@@ -271,127 +397,78 @@ def test_get_investment_accounts_for_client(
     assert len(data) >= 3
 
 
-def test_update_investment_account_success(
+def test_get_investment_accounts_for_client_paginates_with_cursor(
     test_client: TestClient,
     session: Session,
     sample_advisor: "User",
     sample_client: "Client",
+    get_auth_headers: Callable[["User"], dict],
 ):
-    """Test successful update of investment account."""
-    # Create an account first
-    import cactus_wealth.crud as crud
-    from cactus_wealth.schemas import InvestmentAccountCreate
-
-    account_data = InvestmentAccountCreate(
-        platform="Original Platform", account_number="ORIG123", aum=Decimal("20000.00"), client_id=sample_client.id
-    )
-    account = crud.create_client_investment_account(
-        session=session, account_data=account_data, client_id=sample_client.id
+    """Test keyset pagination of investment accounts via X-Next-Cursor."""
+    bulk_insert(
+        session,
+        InvestmentAccount,
+        sample_client.id,
+        [
+            {
+                "platform": f"Platform{i}",
+                "account_number": f"PAGE{i}",
+                "aum": PAGE_AUM,
+            }
+            for i in range(3)
+        ],
     )
 
     headers = get_auth_headers(sample_advisor)
+    url = f"/api/v1/clients/{sample_client.id}/investment-accounts/"
 
-    update_data = {"platform": "Updated Platform", "aum": "35000.00"}
+    first_page = test_client.get(url, params={"limit": 2}, headers=headers)
+    assert first_page.status_code == 200
+    assert len(first_page.json()) == 2
+    next_cursor = first_page.headers["X-Next-Cursor"]
 
-    response = test_client.put(
-        f"/api/v1/investment-accounts/{account.id}", json=update_data, headers=headers
+    second_page = test_client.get(
+        url, params={"limit": 2, "cursor": next_cursor}, headers=headers
     )
+    assert second_page.status_code == 200
+    assert len(second_page.json()) == 1
+    assert "X-Next-Cursor" not in second_page.headers
 
-    assert response.status_code == 200
-    data = response.json()
-    assert data["platform"] == "Updated Platform"
-    assert float(data["aum"]) == 35000.00
-    assert data["account_number"] == "ORIG123"  # Unchanged
+    page_ids = [a["id"] for a in first_page.json() + second_page.json()]
+    assert page_ids == sorted(set(page_ids))
 
 
-def test_delete_investment_account_success(
+@pytest.mark.parametrize("limit", [0, -1, 501])
+def test_get_investment_accounts_for_client_rejects_out_of_range_limit(
     test_client: TestClient,
-    session: Session,
     sample_advisor: "User",
     sample_client: "Client",
+    get_auth_headers: Callable[["User"], dict],
+    limit: int,
 ):
-    """Test successful deletion of investment account."""
-    # Create an account first
-    import cactus_wealth.crud as crud
-    from cactus_wealth.schemas import InvestmentAccountCreate
-
-    account_data = InvestmentAccountCreate(
-        platform="To Delete", account_number="DEL123", aum=Decimal("15000.00"), client_id=sample_client.id
-    )
-    account = crud.create_client_investment_account(
-        session=session, account_data=account_data, client_id=sample_client.id
-    )
-
-    headers = get_auth_headers(sample_advisor)
-
-    response = test_client.delete(
-        f"/api/v1/investment-accounts/{account.id}", headers=headers
+    """Test that page sizes outside 1..500 are rejected instead of paged."""
+    response = test_client.get(
+        f"/api/v1/clients/{sample_client.id}/investment-accounts/",
+        params={"limit": limit},
+        headers=get_auth_headers(sample_advisor),
     )
-
-    assert response.status_code == 200
-    data = response.json()
-    assert data["id"] == account.id
-
-    # Verificar vía API que fue borrado
-    get_response = test_client.get(f"/api/v1/investment-accounts/{account.id}", headers=headers)
-    assert get_response.status_code == 404
+    assert response.status_code == 422
 
 
 # ============ INSURANCE POLICY TESTS ============
 
 
-def test_create_insurance_policy_success(
-    test_client: TestClient,
-    session: Session,
-    sample_advisor: "User",
-    sample_client: "Client",
-):
-    """Test successful creation of insurance policy."""
-    headers = get_auth_headers(sample_advisor)
-
-    policy_data = {
-        "policy_number": "POL123456",
-        "insurance_type": "Seguro de Vida",
-        "premium_amount": "500.00",
-        "coverage_amount": "100000.00",
-        "client_id": sample_client.id,
-    }
-
-    response = test_client.post(
-        f"/api/v1/clients/{sample_client.id}/insurance-policies/",
-        json=policy_data,
-        headers=headers,
-    )
-
-    assert response.status_code == 201
-    data = response.json()
-    assert data["policy_number"] == "POL123456"
-    assert data["insurance_type"] == "Seguro de Vida"
-    assert float(data["premium_amount"]) == 500.00
-    assert float(data["coverage_amount"]) == 100000.00
-    assert data["client_id"] == sample_client.id
-
-
 def test_create_insurance_policy_duplicate_number(
     test_client: TestClient,
     session: Session,
     sample_advisor: "User",
     sample_client: "Client",
+    get_auth_headers: Callable[["User"], dict],
 ):
     """Test that creating policy with duplicate policy number fails."""
     # First create a policy
-    import cactus_wealth.crud as crud
-    from cactus_wealth.schemas import InsurancePolicyCreate
-
-    policy_data = InsurancePolicyCreate(
-        policy_number="DUPLICATE123",
-        insurance_type="Seguro de Vida",
-        premium_amount=Decimal("300.00"),
-        coverage_amount=Decimal("50000.00"),
-        client_id=sample_client.id
-    )
-    crud.create_client_insurance_policy(
-        session=session, policy_data=policy_data, client_id=sample_client.id
+    InsurancePolicyFactory.create(
+        session, client_id=sample_client.id, policy_number="DUPLICATE123"
     )
 
     headers = get_auth_headers(sample_advisor)
@@ -417,9 +494,9 @@ def test_create_insurance_policy_duplicate_number(
 
 def test_create_insurance_policy_forbidden_wrong_advisor(
     test_client: TestClient,
-    session: Session,
     sample_advisor_2: "User",
     sample_client: "Client",
+    get_auth_headers: Callable[["User"], dict],
 ):
     """Test that advisor cannot create policy for client that doesn't belong to them."""
     headers = get_auth_headers(sample_advisor_2)
@@ -442,60 +519,29 @@ def test_create_insurance_policy_forbidden_wrong_advisor(
     assert "Access denied" in response.json()["detail"]
 
 
-def test_get_insurance_policy_success(
-    test_client: TestClient,
-    session: Session,
-    sample_advisor: "User",
-    sample_client: "Client",
-):
-    """Test successful retrieval of insurance policy."""
-    # Create a policy first
-    import cactus_wealth.crud as crud
-    from cactus_wealth.schemas import InsurancePolicyCreate
-
-    policy_data = InsurancePolicyCreate(
-        policy_number="GET123",
-        insurance_type="Seguro de Retiro",
-        premium_amount=Decimal("450.00"),
-        coverage_amount=Decimal("80000.00"),
-        client_id=sample_client.id
-    )
-    policy = crud.create_client_insurance_policy(
-        session=session, policy_data=policy_data, client_id=sample_client.id
-    )
-
-    headers = get_auth_headers(sample_advisor)
-
-    response = test_client.get(f"/api/v1/insurance-policies/{policy.id}", headers=headers)
-
-    assert response.status_code == 200
-    data = response.json()
-    assert data["id"] == policy.id
-    assert data["policy_number"] == "GET123"
-
-
 def test_get_insurance_policies_for_client(
     test_client: TestClient,
     session: Session,
     sample_advisor: "User",
     sample_client: "Client",
+    get_auth_headers: Callable[["User"], dict],
 ):
     """Test getting all insurance policies for a client."""
     # Create multiple policies
-    import cactus_wealth.crud as crud
-    from cactus_wealth.schemas import InsurancePolicyCreate
-
-    for i in range(2):
-        policy_data = InsurancePolicyCreate(
-            policy_number=f"MULTI{i}",
-            insurance_type=f"Tipo{i}",
-            premium_amount=Decimal(f"{200 + i * 100}.00"),
-            coverage_amount=Decimal(f"{40000 + i * 10000}.00"),
-            client_id=sample_client.id
-        )
-        crud.create_client_insurance_policy(
-            session=session, policy_data=policy_data, client_id=sample_client.id
-        )
+    bulk_insert(
+        session,
+        InsurancePolicy,
+        sample_client.id,
+        [
+            {
+                "policy_number": f"MULTI{i}",
+                "insurance_type": f"Tipo{i}",
+                "premium_amount": Decimal(200 + i * 100),
+                "coverage_amount": Decimal(40000 + i * 10000),
+            }
+            for i in range(2)
+        ],
+    )
 
     headers = get_auth_headers(sample_advisor)
 
@@ -508,78 +554,6 @@ def test_get_insurance_policies_for_client(
     assert len(data) == 2
 
 
-def test_update_insurance_policy_success(
-    test_client: TestClient,
-    session: Session,
-    sample_advisor: "User",
-    sample_client: "Client",
-):
-    """Test successful update of insurance policy."""
-    # Create a policy first
-    import cactus_wealth.crud as crud
-    from cactus_wealth.schemas import InsurancePolicyCreate
-
-    policy_data = InsurancePolicyCreate(
-        policy_number="UPDATE123",
-        insurance_type="Original Type",
-        premium_amount=Decimal("300.00"),
-        coverage_amount=Decimal("50000.00"),
-        client_id=sample_client.id
-    )
-    policy = crud.create_client_insurance_policy(
-        session=session, policy_data=policy_data, client_id=sample_client.id
-    )
-
-    headers = get_auth_headers(sample_advisor)
-
-    update_data = {"insurance_type": "Updated Type", "premium_amount": "350.00"}
-
-    response = test_client.put(
-        f"/api/v1/insurance-policies/{policy.id}", json=update_data, headers=headers
-    )
-
-    assert response.status_code == 200
-    data = response.json()
-    assert data["insurance_type"] == "Updated Type"
-    assert float(data["premium_amount"]) == 350.00
-    assert data["policy_number"] == "UPDATE123"  # Unchanged
-
-
-def test_delete_insurance_policy_success(
-    test_client: TestClient,
-    session: Session,
-    sample_advisor: "User",
-    sample_client: "Client",
-):
-    """Test successful deletion of insurance policy."""
-    # Create a policy first
-    import cactus_wealth.crud as crud
-    from cactus_wealth.schemas import InsurancePolicyCreate
-
-    policy_data = InsurancePolicyCreate(
-        policy_number="DELETE123",
-        insurance_type="To Delete",
-        premium_amount=Decimal("200.00"),
-        coverage_amount=Decimal("25000.00"),
-        client_id=sample_client.id
-    )
-    policy = crud.create_client_insurance_policy(
-        session=session, policy_data=policy_data, client_id=sample_client.id
-    )
-
-    headers = get_auth_headers(sample_advisor)
-
-    response = test_client.delete(f"/api/v1/insurance-policies/{policy.id}", headers=headers)
-
-    assert response.status_code == 200
-    data = response.json()
-    assert data["id"] == policy.id
-
-    # Verificar vía API que fue borrado
-    get_response = test_client.get(f"/api/v1/insurance-policies/{policy.id}", headers=headers)
-    assert get_response.status_code == 404
-
-
 # ============ AUTHORIZATION EDGE CASES ============
 
 
@@ -588,23 +562,27 @@ def test_admin_can_access_any_client_accounts(
     session: Session,
     sample_admin: "User",
     sample_client_advisor_2: "Client",
+    get_auth_headers: Callable[["User"], dict],
 ):
     """Test that admin can access accounts for any client."""
     # Create account for advisor_2's client
-    import cactus_wealth.crud as crud
-    from cactus_wealth.schemas import InvestmentAccountCreate
-
-    account_data = InvestmentAccountCreate(
-        platform="Admin Test", account_number="ADMIN789", aum=Decimal("60000.00"), client_id=sample_client_advisor_2.id
-    )
-    account = crud.create_client_investment_account(
-        session=session, account_data=account_data, client_id=sample_client_advisor_2.id
+    [account_id] = bulk_insert(
+        session,
+        InvestmentAccount,
+        sample_client_advisor_2.id,
+        [
+            {
+                "platform": "Admin Test",
+                "account_number": "ADMIN789",
+                "aum": Decimal("60000.00"),
+            }
+        ],
     )
 
     headers = get_auth_headers(sample_admin)
 
     # Admin should be able to access this account
-    response = test_client.get(f"/api/v1/investment-accounts/{account.id}", headers=headers)
+    response = test_client.get(f"/api/v1/investment-accounts/{account_id}", headers=headers)
 
     assert response.status_code == 200
     data = response.json()
@@ -616,26 +594,27 @@ def test_advisor_cannot_access_other_advisor_client_policies(
     session: Session,
     sample_advisor: "User",
     sample_client_advisor_2: "Client",
+    get_auth_headers: Callable[["User"], dict],
 ):
     """Test that advisor cannot access policies of other advisor's clients."""
     # Create policy for advisor_2's client
-    import cactus_wealth.crud as crud
-    from cactus_wealth.schemas import InsurancePolicyCreate
-
-    policy_data = InsurancePolicyCreate(
-        policy_number="FORBIDDEN456",
-        insurance_type="Private Policy",
-        premium_amount=Decimal("600.00"),
-        coverage_amount=Decimal("120000.00"),
-        client_id=sample_client_advisor_2.id
-    )
-    policy = crud.create_client_insurance_policy(
-        session=session, policy_data=policy_data, client_id=sample_client_advisor_2.id
+    [policy_id] = bulk_insert(
+        session,
+        InsurancePolicy,
+        sample_client_advisor_2.id,
+        [
+            {
+                "policy_number": "FORBIDDEN456",
+                "insurance_type": "Private Policy",
+                "premium_amount": Decimal("600.00"),
+                "coverage_amount": Decimal("120000.00"),
+            }
+        ],
     )
 
     headers = get_auth_headers(sample_advisor)
 
     # sample_advisor should NOT be able to access this policy
-    response = test_client.get(f"/api/v1/insurance-policies/{policy.id}", headers=headers)
+    response = test_client.get(f"/api/v1/insurance-policies/{policy_id}", headers=headers)
 
     assert response.status_code == 403
@@ -4,6 +4,7 @@ import sys
 sys.path.insert(
     0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../../../.."))
 )
+from collections.abc import Callable
 from datetime import UTC, datetime, timedelta
 from decimal import Decimal
 
@@ -21,18 +22,20 @@ from cactus_wealth.models import (
     User,
     UserRole,
 )
-from cactus_wealth.security import create_access_token
 from fastapi.testclient import TestClient
 from main import app
+from sqlalchemy import insert
 from sqlmodel import Session  # Solo para type hints si es necesario
 
 
 # Eliminar fixtures locales de session y client, y usar las globales de conftest.py
 # Eliminar imports innecesarios
+# Usuarios, activos y carteras solo se leen: se crean una vez por módulo
+# ('module_session'); reportes y snapshots de cada test van en 'session'
 
 
-@pytest.fixture(name="admin_user")
-def admin_user_fixture(session: Session):
+@pytest.fixture(name="admin_user", scope="module")
+def admin_user_fixture(module_session: Session):
     """Create an admin user for testing."""
     user = User(
         email="admin@test.com",
@@ -41,14 +44,13 @@ def admin_user_fixture(session: Session):
         role=UserRole.ADMIN,
         is_active=True,
     )
-    session.add(user)
-    session.commit()
-    session.refresh(user)
+    module_session.add(user)
+    module_session.commit()
     return user
 
 
-@pytest.fixture(name="advisor_user")
-def advisor_user_fixture(session: Session):
+@pytest.fixture(name="advisor_user", scope="module")
+def advisor_user_fixture(module_session: Session):
     """Create a senior advisor user for testing."""
     user = User(
         email="advisor@test.com",
@@ -57,14 +59,13 @@ def advisor_user_fixture(session: Session):
         role=UserRole.SENIOR_ADVISOR,
         is_active=True,
     )
-    session.add(user)
-    session.commit()
-    session.refresh(user)
+    module_session.add(user)
+    module_session.commit()
     return user
 
 
-@pytest.fixture(name="test_assets")
-def test_assets_fixture(session: Session):
+@pytest.fixture(name="test_assets", scope="module")
+def test_assets_fixture(module_session: Session):
     """Create test assets."""
     assets = [
         Asset(ticker_symbol="AAPL", name="Apple Inc.", asset_type=AssetType.STOCK),
@@ -72,20 +73,17 @@ def test_assets_fixture(session: Session):
         Asset(ticker_symbol="SPY", name="SPDR S&P 500 ETF", asset_type=AssetType.ETF),
     ]
 
-    for asset in assets:
-        session.add(asset)
-
-    session.commit()
-
-    for asset in assets:
-        session.refresh(asset)
-
+    module_session.add_all(assets)
+    module_session.commit()
     return assets
 
 
-@pytest.fixture(name="test_clients_and_portfolios")
+@pytest.fixture(name="test_clients_and_portfolios", scope="module")
 def test_clients_and_portfolios_fixture(
-    session: Session, admin_user: User, advisor_user: User, test_assets: list[Asset]
+    module_session: Session,
+    admin_user: User,
+    advisor_user: User,
+    test_assets: list[Asset],
 ):
     """Create test clients with portfolios and positions."""
 
@@ -116,13 +114,8 @@ def test_clients_and_portfolios_fixture(
     )
 
     clients = [admin_client1, admin_client2, advisor_client1]
-    for client in clients:
-        session.add(client)
-
-    session.commit()
-
-    for client in clients:
-        session.refresh(client)
+    module_session.add_all(clients)
+    module_session.flush()
 
     # Create portfolios and positions
     portfolios_data = [
@@ -174,28 +167,40 @@ def test_clients_and_portfolios_fixture(
         },
     ]
 
-    portfolios = []
-    for portfolio_data in portfolios_data:
-        portfolio = Portfolio(
-            name=portfolio_data["name"], client_id=portfolio_data["client"].id
-        )
-        session.add(portfolio)
-        session.commit()
-        session.refresh(portfolio)
-        portfolios.append(portfolio)
-
-        # Add positions to portfolio
-        for position_data in portfolio_data["positions"]:
-            position = Position(
-                quantity=position_data["quantity"],
-                purchase_price=position_data["purchase_price"],
-                average_price=position_data.get("average_price", position_data["purchase_price"]),
-                current_price=position_data.get("current_price", position_data["purchase_price"]),
-                portfolio_id=portfolio.id,
-                asset_id=position_data["asset"].id,
-            )
-            session.add(position)
-        session.commit()
+    # Portfolios in one INSERT ... RETURNING (ids and objects come back in
+    # parameter order), then every position in one executemany. Core inserts
+    # skip the models' Python-side default factories, so timestamps go here
+    now = datetime.utcnow()
+    timestamps = {"created_at": now, "updated_at": now}
+    portfolios = module_session.scalars(
+        insert(Portfolio).returning(Portfolio, sort_by_parameter_order=True),
+        [
+            {
+                "name": portfolio_data["name"],
+                "client_id": portfolio_data["client"].id,
+                **timestamps,
+            }
+            for portfolio_data in portfolios_data
+        ],
+    ).all()
+
+    module_session.execute(
+        insert(Position),
+        [
+            {
+                "quantity": position_data["quantity"],
+                "purchase_price": position_data["purchase_price"],
+                "average_price": position_data.get("average_price", position_data["purchase_price"]),
+                "current_price": position_data.get("current_price", position_data["purchase_price"]),
+                "portfolio_id": portfolio.id,
+                "asset_id": position_data["asset"].id,
+                **timestamps,
+            }
+            for portfolio, portfolio_data in zip(portfolios, portfolios_data)
+            for position_data in portfolio_data["positions"]
+        ],
+    )
+    module_session.commit()
 
     return {
         "clients": clients,
@@ -206,12 +211,15 @@ def test_clients_and_portfolios_fixture(
 
 
 def test_dashboard_summary_admin_user(
-    test_client: TestClient, admin_user: User, test_clients_and_portfolios: dict
+    test_client: TestClient,
+    admin_user: User,
+    test_clients_and_portfolios: dict,
+    token_for: Callable[[str], str],
 ):
     """Test dashboard summary endpoint with admin user - should see all clients."""
 
     # Create access token for admin user
-    token = create_access_token(data={"sub": admin_user.email})
+    token = token_for(admin_user.email)
     headers = {"Authorization": f"Bearer {token}"}
 
     # Call dashboard summary endpoint
@@ -237,12 +245,15 @@ def test_dashboard_summary_admin_user(
 
 
 def test_dashboard_summary_advisor_user(
-    test_client: TestClient, advisor_user: User, test_clients_and_portfolios: dict
+    test_client: TestClient,
+    advisor_user: User,
+    test_clients_and_portfolios: dict,
+    token_for: Callable[[str], str],
 ):
     """Test dashboard summary endpoint with advisor user - should see only assigned clients."""
 
     # Create access token for advisor user
-    token = create_access_token(data={"sub": advisor_user.email})
+    token = token_for(advisor_user.email)
     headers = {"Authorization": f"Bearer {token}"}
 
     # Call dashboard summary endpoint
@@ -289,12 +300,15 @@ def test_dashboard_summary_invalid_token(test_client: TestClient):
 
 
 def test_dashboard_summary_response_schema(
-    test_client: TestClient, admin_user: User, test_clients_and_portfolios: dict
+    test_client: TestClient,
+    admin_user: User,
+    test_clients_and_portfolios: dict,
+    token_for: Callable[[str], str],
 ):
     """Test that dashboard summary response matches expected schema."""
 
     # Create access token for admin user
-    token = create_access_token(data={"sub": admin_user.email})
+    token = token_for(admin_user.email)
     headers = {"Authorization": f"Bearer {token}"}
 
     # Call dashboard summary endpoint
@@ -330,6 +344,7 @@ def test_dashboard_reports_kpi_with_generated_reports(
     admin_user: User,
     advisor_user: User,
     test_clients_and_portfolios: dict,
+    token_for: Callable[[str], str],
 ):
     """Test that reports_generated_this_quarter KPI correctly counts generated reports."""
     from datetime import datetime
@@ -338,40 +353,34 @@ def test_dashboard_reports_kpi_with_generated_reports(
     admin_client = test_clients_and_portfolios["admin_clients"][0]
     advisor_client = test_clients_and_portfolios["advisor_clients"][0]
 
-    # Create reports generated by admin user
-    admin_report1 = Report(
-        client_id=admin_client.id,
-        advisor_id=admin_user.id,
-        file_path="/media/reports/admin_report_1.pdf",
-        report_type="PORTFOLIO_SUMMARY",
-        generated_at=datetime.now(UTC),
-    )
-
-    admin_report2 = Report(
-        client_id=admin_client.id,
-        advisor_id=admin_user.id,
-        file_path="/media/reports/admin_report_2.pdf",
-        report_type="PORTFOLIO_SUMMARY",
-        generated_at=datetime.now(UTC),
-    )
-
-    # Create report generated by advisor user
-    advisor_report1 = Report(
-        client_id=advisor_client.id,
-        advisor_id=advisor_user.id,
-        file_path="/media/reports/advisor_report_1.pdf",
-        report_type="PORTFOLIO_SUMMARY",
-        generated_at=datetime.now(UTC),
+    # Create two reports generated by admin user and one by advisor user,
+    # in a single executemany
+    now = datetime.now(UTC)
+    session.execute(
+        insert(Report),
+        [
+            {
+                "client_id": client_id,
+                "advisor_id": advisor_id,
+                "file_path": file_path,
+                "report_type": "PORTFOLIO_SUMMARY",
+                "generated_at": now,
+            }
+            for client_id, advisor_id, file_path in [
+                (admin_client.id, admin_user.id, "/media/reports/admin_report_1.pdf"),
+                (admin_client.id, admin_user.id, "/media/reports/admin_report_2.pdf"),
+                (
+                    advisor_client.id,
+                    advisor_user.id,
+                    "/media/reports/advisor_report_1.pdf",
+                ),
+            ]
+        ],
     )
-
-    reports = [admin_report1, admin_report2, advisor_report1]
-    for report in reports:
-        session.add(report)
-
     session.commit()
 
     # Test admin user - should see all 3 reports
-    admin_token = create_access_token(data={"sub": admin_user.email})
+    admin_token = token_for(admin_user.email)
     admin_headers = {"Authorization": f"Bearer {admin_token}"}
 
     admin_response = test_client.get("/api/v1/dashboard/summary", headers=admin_headers)
@@ -381,7 +390,7 @@ def test_dashboard_reports_kpi_with_generated_reports(
     assert admin_data["reports_generated_this_quarter"] == 3
 
     # Test advisor user - should see only their 1 report
-    advisor_token = create_access_token(data={"sub": advisor_user.email})
+    advisor_token = token_for(advisor_user.email)
     advisor_headers = {"Authorization": f"Bearer {advisor_token}"}
 
     advisor_response = test_client.get("/api/v1/dashboard/summary", headers=advisor_headers)
@@ -396,6 +405,7 @@ def test_dashboard_reports_kpi_with_old_reports(
     test_client: TestClient,
     admin_user: User,
     test_clients_and_portfolios: dict,
+    token_for: Callable[[str], str],
 ):
     """Test that dashboard reports KPI only counts reports from current quarter."""
     from datetime import datetime, timedelta
@@ -413,7 +423,7 @@ def test_dashboard_reports_kpi_with_old_reports(
     session.commit()
 
     # Create access token
-    access_token = create_access_token(data={"sub": admin_user.email})
+    access_token = token_for(admin_user.email)
 
     # Test dashboard endpoint
     response = test_client.get(
@@ -432,6 +442,7 @@ def test_dashboard_monthly_growth_with_snapshots(
     test_client: TestClient,
     admin_user: User,
     test_clients_and_portfolios: dict,
+    token_for: Callable[[str], str],
 ):
     """Test monthly growth calculation with historical portfolio snapshots."""
 
@@ -458,29 +469,25 @@ def test_dashboard_monthly_growth_with_snapshots(
         },
     ]
 
-    # Create start-of-month snapshots
-    for data in snapshot_data:
-        start_of_month_snapshot = PortfolioSnapshot(
-            portfolio_id=data["portfolio_id"],
-            value=data["start_of_month_value"],
-            timestamp=current_month_start,
-        )
-        session.add(start_of_month_snapshot)
-
-    # Create current snapshots (few days ago to simulate recent data)
+    # Create start-of-month and current snapshots (few days ago to simulate
+    # recent data) in a single executemany
     recent_date = now - timedelta(days=2)
-    for data in snapshot_data:
-        current_snapshot = PortfolioSnapshot(
-            portfolio_id=data["portfolio_id"],
-            value=data["current_value"],
-            timestamp=recent_date,
-        )
-        session.add(current_snapshot)
+    session.execute(
+        insert(PortfolioSnapshot),
+        [
+            {"portfolio_id": data["portfolio_id"], "value": value, "timestamp": timestamp}
+            for data in snapshot_data
+            for value, timestamp in [
+                (data["start_of_month_value"], current_month_start),
+                (data["current_value"], recent_date),
+            ]
+        ],
+    )
 
     session.commit()
 
     # Create access token
-    access_token = create_access_token(data={"sub": admin_user.email})
+    access_token = token_for(admin_user.email)
 
     # Test dashboard endpoint
     response = test_client.get(
@@ -506,15 +513,15 @@ def test_dashboard_monthly_growth_with_snapshots(
 
 
 def test_dashboard_monthly_growth_no_historical_data(
-    session: Session,
     test_client: TestClient,
     admin_user: User,
     test_clients_and_portfolios: dict,
+    token_for: Callable[[str], str],
 ):
     """Test monthly growth returns None when no historical snapshot data exists."""
 
     # Create access token
-    access_token = create_access_token(data={"sub": admin_user.email})
+    access_token = token_for(admin_user.email)
 
     # Test dashboard endpoint (no snapshots created)
     response = test_client.get(
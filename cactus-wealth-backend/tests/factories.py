@@ -0,0 +1,56 @@
+"""
+Constructores de filas de prueba al estilo Factory Boy.
+
+Cada factory combina valores por defecto con los campos recibidos, reutiliza
+la fila existente si coincide en los campos de `lookup` (get-or-create) y solo
+hace flush: el commit real lo descarta el SAVEPOINT de la fixture `session`.
+"""
+
+from decimal import Decimal
+from typing import Any
+
+from cactus_wealth.models import InsurancePolicy, InvestmentAccount
+from sqlmodel import Session, SQLModel, select
+
+
+class ModelFactory:
+    """Base de las factories: subclases definen model, lookup y defaults."""
+
+    model: type[SQLModel]
+    lookup: tuple[str, ...] = ()
+    defaults: dict[str, Any] = {}
+
+    @classmethod
+    def create(cls, session: Session, **fields: Any) -> SQLModel:
+        values = {**cls.defaults, **fields}
+        if cls.lookup:
+            criteria = {field: values[field] for field in cls.lookup}
+            existing = session.exec(select(cls.model).filter_by(**criteria)).first()
+            if existing is not None:
+                return existing
+
+        instance = cls.model(**values)
+        session.add(instance)
+        session.flush()
+        return instance
+
+
+class InvestmentAccountFactory(ModelFactory):
+    model = InvestmentAccount
+    lookup = ("client_id", "account_number")
+    defaults = {
+        "platform": "Test Platform",
+        "account_number": "TEST123",
+        "aum": Decimal("30000.00"),
+    }
+
+
+class InsurancePolicyFactory(ModelFactory):
+    model = InsurancePolicy
+    lookup = ("policy_number",)
+    defaults = {
+        "policy_number": "POL123",
+        "insurance_type": "Seguro de Vida",
+        "premium_amount": Decimal("300.00"),
+        "coverage_amount": Decimal("50000.00"),
+    }
@@ -8,7 +8,6 @@ from unittest.mock import Mock, patch
 
 import pytest
 from fastapi.testclient import TestClient
-import sqlalchemy
 from sqlmodel import Session
 
 
@@ -43,13 +42,6 @@ def client_and_token(session, test_client):
     return client.id, headers
 
 
-@pytest.fixture(autouse=True)
-def cleanup_db(session):
-    session.execute(sqlalchemy.text('TRUNCATE TABLE client_notes, investment_accounts, insurance_policies, clients, users RESTART IDENTITY CASCADE'))
-    session.commit()
-    session.rollback()
-
-
 class TestClientDeletionIntegration:
     """Pruebas de integración para eliminación de clientes con relaciones."""
 
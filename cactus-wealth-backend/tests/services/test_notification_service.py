@@ -0,0 +1,92 @@
+from unittest.mock import Mock, patch
+
+import pytest
+import redis
+from cactus_wealth.models import Notification
+from cactus_wealth.services import NotificationService
+from sqlmodel import Session
+
+
+class TestNotificationService:
+    """Test cases for NotificationService."""
+
+    @pytest.fixture
+    def mock_db_session(self):
+        """Mock database session."""
+        return Mock(spec=Session)
+
+    @pytest.fixture
+    def notification_service(self, mock_db_session):
+        """Create NotificationService instance with a mocked session."""
+        return NotificationService(mock_db_session)
+
+    def test_create_notifications_commits_once(
+        self, notification_service, mock_db_session
+    ):
+        """A batch of notifications is inserted with one flush and one commit."""
+        notifications = notification_service.create_notifications(
+            [(1, "Snapshot ready"), (2, "New client added")]
+        )
+
+        assert [n.user_id for n in notifications] == [1, 2]
+        assert all(isinstance(n, Notification) for n in notifications)
+        mock_db_session.add_all.assert_called_once_with(notifications)
+        mock_db_session.flush.assert_called_once()
+        mock_db_session.commit.assert_called_once()
+        mock_db_session.refresh.assert_not_called()
+
+    def test_create_notifications_with_no_items_skips_database(
+        self, notification_service, mock_db_session
+    ):
+        """An empty batch never touches the session."""
+        assert notification_service.create_notifications([]) == []
+        mock_db_session.commit.assert_not_called()
+
+    def test_enqueue_notifications_pipelines_xadds(self, notification_service):
+        """A batch is queued with one pipelined round trip to Redis."""
+        mock_redis = Mock()
+        mock_redis.pipeline.return_value.execute.return_value = ["1-0", "1-1"]
+        with patch("cactus_wealth.services.REDIS_AVAILABLE", True), patch(
+            "cactus_wealth.services.redis_client", mock_redis
+        ):
+            notification_service.enqueue_notifications(
+                [(1, "Snapshot ready"), (2, "Snapshot ready")]
+            )
+
+        mock_redis.pipeline.assert_called_once_with(transaction=False)
+        pipe = mock_redis.pipeline.return_value
+        assert pipe.xadd.call_count == 2
+        pipe.execute.assert_called_once_with(raise_on_error=False)
+        mock_redis.xadd.assert_not_called()
+
+    def test_enqueue_notifications_inserts_only_failed_xadds(
+        self, notification_service, mock_db_session
+    ):
+        """Entries that reached the stream are not inserted a second time."""
+        mock_redis = Mock()
+        mock_redis.pipeline.return_value.execute.return_value = [
+            "1-0",
+            redis.ResponseError("OOM command not allowed"),
+        ]
+        with patch("cactus_wealth.services.REDIS_AVAILABLE", True), patch(
+            "cactus_wealth.services.redis_client", mock_redis
+        ):
+            notification_service.enqueue_notifications(
+                [(1, "Snapshot ready"), (2, "Snapshot ready")]
+            )
+
+        (inserted,) = mock_db_session.add_all.call_args[0]
+        assert [n.user_id for n in inserted] == [2]
+        mock_db_session.commit.assert_called_once()
+
+    def test_enqueue_notifications_falls_back_to_one_commit(
+        self, notification_service, mock_db_session
+    ):
+        """Without Redis the batch is persisted with a single commit."""
+        with patch("cactus_wealth.services.REDIS_AVAILABLE", False):
+            notification_service.enqueue_notifications(
+                [(1, "Snapshot ready"), (2, "Snapshot ready")]
+            )
+
+        mock_db_session.add_all.assert_called_once()
+        mock_db_session.commit.assert_called_once()
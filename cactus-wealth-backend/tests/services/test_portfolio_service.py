@@ -1,4 +1,5 @@
 from datetime import datetime
+from decimal import Decimal
 from unittest.mock import AsyncMock, Mock, patch
 
 import numpy as np
@@ -9,16 +10,18 @@ from cactus_wealth.schemas import (
     BacktestResponse,
     PortfolioComposition,
 )
-from cactus_wealth.services import PortfolioBacktestService
+from cactus_wealth.services import PortfolioBacktestService, PortfolioService
 
 
 class TestPortfolioBacktestService:
     """Test cases for PortfolioBacktestService backtesting functionality."""
 
     @pytest.fixture
-    def backtest_service(self):
-        """Create PortfolioBacktestService instance."""
-        return PortfolioBacktestService()
+    def backtest_service(self, tmp_path):
+        """Create PortfolioBacktestService instance with an isolated disk cache."""
+        service = PortfolioBacktestService()
+        service.disk_cache_dir = tmp_path
+        return service
 
     @pytest.fixture
     def sample_historical_data(self):
@@ -106,6 +109,34 @@ class TestPortfolioBacktestService:
                 assert metrics["max_drawdown"] <= 0  # Drawdown should be negative
                 assert metrics["start_value"] == 100.0  # Default start value
 
+    @pytest.mark.asyncio
+    async def test_short_period_backtest_skips_dividend_lookup(
+        self, backtest_service, sample_composition, sample_historical_data
+    ):
+        """Five-day backtests never reach the dividend download."""
+        request = BacktestRequest(
+            composition=sample_composition, benchmarks=["SPY"], period="5d"
+        )
+
+        with (
+            patch.object(
+                backtest_service,
+                "_download_historical_data_cached",
+                new_callable=AsyncMock,
+            ) as mock_download,
+            patch.object(
+                backtest_service,
+                "_download_dividend_data_concurrent",
+                new_callable=AsyncMock,
+            ) as mock_dividends,
+        ):
+            mock_download.return_value = sample_historical_data.tail(5)
+
+            result = await backtest_service.perform_backtest(request)
+
+        mock_dividends.assert_not_called()
+        assert all(point.dividend_events == [] for point in result.data_points)
+
     @pytest.mark.asyncio
     async def test_backtest_with_invalid_weights(
         self, backtest_service, sample_composition
@@ -192,7 +223,11 @@ class TestPortfolioBacktestService:
         This validates the fix for the tolist() cache error.
         """
         # Mock Redis client
-        mock_redis = Mock()
+        mock_redis = AsyncMock()
+        mock_redis.mget.return_value = [None]
+        mock_pipe = Mock()
+        mock_pipe.execute = AsyncMock()
+        mock_redis.pipeline = Mock(return_value=mock_pipe)
         backtest_service.redis_client = mock_redis
 
         # Test with Series (normal case)
@@ -215,8 +250,9 @@ class TestPortfolioBacktestService:
                     ["SPY"], "1mo"
                 )
 
-                # Verify cache was called (serialization didn't fail)
-                mock_redis.setex.assert_called()
+                # Verify cache was written (serialization didn't fail)
+                mock_pipe.setex.assert_called()
+                mock_pipe.execute.assert_awaited_once()
 
                 # Verify result structure
                 assert isinstance(result, pd.DataFrame)
@@ -228,6 +264,168 @@ class TestPortfolioBacktestService:
                 else:
                     raise
 
+    @pytest.mark.asyncio
+    async def test_cached_prices_are_read_with_single_mget(self, backtest_service):
+        """Cache hits come from one MGET and only misses reach yfinance."""
+        cached_spy = backtest_service._encode_series(
+            pd.Series(
+                [100.0, 101.0, 102.0], index=pd.date_range("2023-01-02", periods=3)
+            )
+        )
+        mock_redis = AsyncMock()
+        mock_redis.mget.return_value = [cached_spy, None]
+        mock_pipe = Mock()
+        mock_pipe.execute = AsyncMock()
+        mock_redis.pipeline = Mock(return_value=mock_pipe)
+        backtest_service.redis_client = mock_redis
+
+        aapl_data = pd.DataFrame(
+            {"Close": [150.0, 151.0, 152.0]},
+            index=pd.date_range("2023-01-02", periods=3),
+        )
+
+        with patch("yfinance.download", return_value=aapl_data) as mock_yf:
+            result = await backtest_service._download_historical_data_cached(
+                ["SPY", "AAPL"], "1mo"
+            )
+
+        mock_redis.mget.assert_called_once()
+        mock_redis.get.assert_not_called()
+        assert mock_yf.call_count == 1
+        assert mock_yf.call_args[0][0] == ["AAPL"]
+        # Only the freshly downloaded ticker is written back, in one pipeline
+        assert mock_pipe.setex.call_count == 1
+        assert mock_pipe.setex.call_args[0][0] == "yfinance:prices:AAPL:1mo"
+        mock_pipe.execute.assert_awaited_once()
+        assert list(result.columns) == ["SPY", "AAPL"]
+        assert len(result) == 3
+
+    @pytest.mark.asyncio
+    async def test_disk_cache_serves_redis_misses(self, backtest_service):
+        """Series evicted from Redis are read from disk and copied back."""
+        spy = pd.Series(
+            [400.0, 401.0, 402.0], index=pd.date_range("2023-01-02", periods=3)
+        )
+        cache_key = backtest_service._generate_cache_key("SPY", "1mo", "prices")
+        backtest_service._disk_cache_write(
+            {cache_key: backtest_service._encode_series(spy)}
+        )
+
+        mock_redis = AsyncMock()
+        mock_redis.mget.return_value = [None]
+        mock_pipe = Mock()
+        mock_pipe.execute = AsyncMock()
+        mock_redis.pipeline = Mock(return_value=mock_pipe)
+        backtest_service.redis_client = mock_redis
+
+        with patch("yfinance.download") as mock_yf:
+            result = await backtest_service._download_historical_data_cached(
+                ["SPY"], "1mo"
+            )
+
+        mock_yf.assert_not_called()
+        assert result["SPY"].tolist() == [400.0, 401.0, 402.0]
+        assert mock_pipe.setex.call_args[0][0] == cache_key
+
+    def test_disk_cache_write_replaces_entry_without_leftovers(
+        self, backtest_service, tmp_path
+    ):
+        """Rewriting a key replaces the file and leaves no temporary files."""
+        cache_key = backtest_service._generate_cache_key("SPY", "1mo", "prices")
+
+        backtest_service._disk_cache_write({cache_key: b"old"})
+        backtest_service._disk_cache_write({cache_key: b"new"})
+
+        assert backtest_service._disk_cache_read([cache_key]) == {cache_key: b"new"}
+        assert [p.suffix for p in tmp_path.iterdir()] == [".bin"]
+
+    @pytest.mark.asyncio
+    async def test_cache_misses_are_downloaded_in_one_request(self, backtest_service):
+        """All missing tickers are fetched by a single multi-ticker download."""
+        backtest_service.redis_client = None
+        dates = pd.date_range("2023-01-02", periods=3)
+        multi_ticker_data = pd.concat(
+            {
+                "SPY": pd.DataFrame({"Close": [400.0, 401.0, 402.0]}, index=dates),
+                "AAPL": pd.DataFrame({"Close": [150.0, None, 152.0]}, index=dates),
+            },
+            axis=1,
+        )
+
+        with patch("yfinance.download", return_value=multi_ticker_data) as mock_yf:
+            result = await backtest_service._download_historical_data_cached(
+                ["SPY", "AAPL"], "1mo"
+            )
+
+        mock_yf.assert_called_once()
+        assert mock_yf.call_args[0][0] == ["SPY", "AAPL"]
+        assert list(result.columns) == ["SPY", "AAPL"]
+        assert len(result) == 2  # Row with a missing AAPL close is dropped
+
+    def test_series_cache_encoding_round_trip(self, backtest_service):
+        """Binary cache encoding preserves values and reduces dates to days."""
+        series = pd.Series(
+            [0.5, 0.52],
+            index=pd.DatetimeIndex(
+                ["2023-03-01 09:30", "2023-06-01 09:30"], tz="America/New_York"
+            ),
+        )
+
+        decoded = backtest_service._decode_series(
+            backtest_service._encode_series(series)
+        )
+
+        assert decoded.tolist() == [0.5, 0.52]
+        assert list(decoded.index) == list(pd.to_datetime(["2023-03-01", "2023-06-01"]))
+
+        empty = backtest_service._decode_series(
+            backtest_service._encode_series(pd.Series(dtype=float))
+        )
+        assert empty.empty
+
+    def test_performance_metrics_on_known_returns(self, backtest_service):
+        """Metrics match hand-computed values for a rise, fall and recovery."""
+        daily_returns = pd.Series([0.0, 0.10, -0.20, 0.25])
+        benchmark = pd.Series([100.0, 105.0, 110.25])
+
+        metrics = backtest_service._calculate_performance_metrics_corrected(
+            daily_returns, {"SPY": benchmark}
+        )
+
+        assert metrics["total_return"] == pytest.approx(0.10)
+        assert metrics["max_drawdown"] == pytest.approx(-0.20)
+        assert metrics["annualized_volatility"] == pytest.approx(
+            daily_returns.std() * np.sqrt(252)
+        )
+        assert metrics["trading_days"] == 4
+        assert metrics["SPY_total_return"] == pytest.approx(0.1025)
+        assert metrics["vs_SPY"] == pytest.approx(-0.0025)
+
+    def test_data_points_attach_dividends_by_local_day(self, backtest_service):
+        """Dividends land on their local calendar day, first payment per ticker."""
+        dates = pd.date_range("2023-01-02", periods=3)
+        portfolio = pd.Series([100.0, 101.0, 102.0], index=dates)
+        benchmarks = {"SPY": pd.Series([100.0, 100.5], index=dates[:2])}
+        dividends = {
+            "SPY": pd.Series(
+                [0.5, 0.6],
+                index=pd.DatetimeIndex(
+                    ["2023-01-03 00:00", "2023-01-03 00:00"], tz="America/New_York"
+                ),
+            ),
+            "AAPL": pd.Series(dtype=float),
+        }
+
+        points = backtest_service._generate_data_points(
+            dates, portfolio, benchmarks, dividends
+        )
+
+        assert [p.date for p in points] == ["2023-01-02", "2023-01-03", "2023-01-04"]
+        assert [p.portfolio_value for p in points] == [100.0, 101.0, 102.0]
+        assert points[1].dividend_events == [{"ticker": "SPY", "amount": 0.5}]
+        assert points[0].dividend_events == []
+        assert points[2].benchmark_values == {}
+
     def test_ensure_timezone_aware_utility_function(self, backtest_service):
         """
         Test the _ensure_timezone_aware utility function handles all timezone scenarios.
@@ -304,3 +502,91 @@ class TestPortfolioBacktestService:
             except Exception:
                 # Other exceptions are acceptable for testing purposes
                 pass
+
+
+class TestPortfolioServiceBulkSnapshots:
+    """Test cases for PortfolioService.create_snapshots_for_portfolios."""
+
+    @pytest.fixture
+    def portfolio_service(self):
+        """Create PortfolioService with mocked repositories and provider."""
+        service = PortfolioService(Mock(), Mock())
+        service.portfolio_repo = Mock()
+        service.notification_service = Mock()
+        return service
+
+    @staticmethod
+    def _portfolio(portfolio_id, owner_id, positions):
+        """Build a mock portfolio holding (ticker, quantity) positions."""
+        portfolio = Mock(id=portfolio_id, client=Mock(owner_id=owner_id))
+        portfolio.name = f"Portfolio {portfolio_id}"
+        portfolio.positions = [
+            Mock(quantity=quantity, asset=Mock(ticker_symbol=ticker))
+            for ticker, quantity in positions
+        ]
+        return portfolio
+
+    def test_create_snapshots_prices_each_ticker_once(self, portfolio_service):
+        """Shared tickers are priced in one request and snapshots in one batch."""
+        portfolio_service.portfolio_repo.get_portfolios_with_positions.return_value = [
+            self._portfolio(1, 10, [("AAPL", 2), ("MSFT", 1)]),
+            self._portfolio(2, 10, [("AAPL", 3)]),
+        ]
+        portfolio_service.portfolio_repo.create_snapshots_bulk.return_value = 2
+        provider = portfolio_service.market_data_provider
+        provider.get_current_prices.return_value = {"AAPL": 100.0, "MSFT": 50.0}
+
+        with patch(
+            "cactus_wealth.services.DashboardService.invalidate_cached_dashboards"
+        ) as mock_invalidate:
+            created = portfolio_service.create_snapshots_for_portfolios([1, 2])
+
+        assert created == 2
+        provider.get_current_prices.assert_called_once_with(["AAPL", "MSFT"])
+        provider.get_current_price.assert_not_called()
+        values = portfolio_service.portfolio_repo.create_snapshots_bulk.call_args[0][0]
+        assert values == {1: Decimal("250.0"), 2: Decimal("300.0")}
+        mock_invalidate.assert_called_once_with(10)
+        enqueue = portfolio_service.notification_service.enqueue_notifications
+        enqueue.assert_called_once()
+        assert [user_id for user_id, _ in enqueue.call_args[0][0]] == [10, 10]
+
+    def test_create_snapshots_skips_unpriceable_portfolios(self, portfolio_service):
+        """A pricing failure skips that portfolio without aborting the batch."""
+        portfolio_service.portfolio_repo.get_portfolios_with_positions.return_value = [
+            self._portfolio(1, 10, [("AAPL", 1)]),
+            self._portfolio(2, 20, [("BROKEN", 1)]),
+        ]
+        portfolio_service.portfolio_repo.create_snapshots_bulk.return_value = 1
+        provider = portfolio_service.market_data_provider
+        provider.get_current_prices.return_value = {"AAPL": 10.0}
+        provider.get_current_price.side_effect = ValueError("no price")
+
+        with patch(
+            "cactus_wealth.services.DashboardService.invalidate_cached_dashboards"
+        ):
+            created = portfolio_service.create_snapshots_for_portfolios([1, 2])
+
+        assert created == 1
+        values = portfolio_service.portfolio_repo.create_snapshots_bulk.call_args[0][0]
+        assert list(values) == [1]
+
+    def test_create_snapshots_uses_prefetched_prices(self, portfolio_service):
+        """Prefetched prices are used and only unknown tickers are requested."""
+        portfolio_service.portfolio_repo.get_portfolios_with_positions.return_value = [
+            self._portfolio(1, 10, [("AAPL", 2), ("MSFT", 1)]),
+        ]
+        portfolio_service.portfolio_repo.create_snapshots_bulk.return_value = 1
+        provider = portfolio_service.market_data_provider
+        provider.get_current_prices.return_value = {"MSFT": 50.0}
+
+        with patch(
+            "cactus_wealth.services.DashboardService.invalidate_cached_dashboards"
+        ):
+            portfolio_service.create_snapshots_for_portfolios(
+                [1], prices={"AAPL": 100.0}
+            )
+
+        provider.get_current_prices.assert_called_once_with(["MSFT"])
+        values = portfolio_service.portfolio_repo.create_snapshots_bulk.call_args[0][0]
+        assert values == {1: Decimal("250.0")}
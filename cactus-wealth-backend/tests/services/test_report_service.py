@@ -1,5 +1,5 @@
 from datetime import UTC, datetime
-from unittest.mock import MagicMock, Mock, patch
+from unittest.mock import AsyncMock, MagicMock, Mock, patch
 
 import pytest
 from cactus_wealth import schemas
@@ -160,7 +160,7 @@ class TestReportService:
                 # Mock file system operations
                 with (
                     patch("pathlib.Path.mkdir"),
-                    patch("builtins.open", mock_open_func()),
+                    patch("cactus_wealth.services.aiofiles.open", mock_open_func()),
                     patch.object(mock_db_session, "add"),
                     patch.object(mock_db_session, "commit"),
                     patch.object(mock_db_session, "refresh"),
@@ -349,11 +349,11 @@ class TestReportService:
 
 
 def mock_open_func():
-    """Create a mock for the open function."""
+    """Create a mock for the aiofiles open function."""
     m = MagicMock()
     handle = MagicMock()
-    handle.write.return_value = None
-    handle.__enter__.return_value = handle
-    handle.__exit__.return_value = None
+    handle.write = AsyncMock(return_value=None)
+    handle.__aenter__ = AsyncMock(return_value=handle)
+    handle.__aexit__ = AsyncMock(return_value=None)
     m.return_value = handle
     return m